@@ -30,11 +30,14 @@ bl_info = {
 ###############################
 
 import bpy
-import os, re, shutil, random, string
+import os, re, sys, time, zlib, struct, shutil, random, string, fnmatch, tempfile, subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from mathutils import Vector
-from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty, CollectionProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty, FloatProperty, CollectionProperty
 from bpy_extras.io_utils import ImportHelper
-import json 
+import json, hashlib
+import numpy as np
 
 def set_custom_property(target, prop_name, value):
     """
@@ -45,6 +48,20 @@ def set_custom_property(target, prop_name, value):
         target["_RNA_UI"] = {}
     target["_RNA_UI"][prop_name] = {"description": value}
 
+GODOT_SUFFIX_ITEMS = [
+    ("-navmesh", "-navmesh", "Suffix for navigation meshes"),
+    ("-occ", "-occ", "Suffix for occlusion objects"),
+    ("-rigid", "-rigid", "Suffix for rigid bodies"),
+    ("-cycle", "-cycle", "Suffix for cyclic animations or cycles"),
+    ("-vehicle", "-vehicle", "Suffix for vehicles"),
+    ("-wheel", "-wheel", "Suffix for wheels"),
+    ("-col", "-col", "Suffix for collision objects"),
+    ("-convcol", "-convcol", "Suffix for convex collisions"),
+    ("-colonly", "-colonly", "Suffix for collision-only objects"),
+    ("-convcolonly", "-convcolonly", "Suffix for convex collision-only objects")
+]
+GODOT_SUFFIXES = tuple(item[0] for item in GODOT_SUFFIX_ITEMS)
+
 ###############################
 # Update Callback Functions
 ###############################
@@ -179,6 +196,54 @@ class GodotObjectProperty(bpy.types.PropertyGroup):
         description="Custom Godot path for this object property"
     )
 
+class GodotSuffixRule(bpy.types.PropertyGroup):
+    match_type: EnumProperty(
+        name="Match",
+        description="What the rule matches objects by",
+        items=[
+            ("COLLECTION", "Collection", "Objects inside the named collection (including child collections)"),
+            ("NAME", "Name Pattern", "Object names matching a wildcard pattern, e.g. Rock_*"),
+            ("PROPERTY", "Custom Property", "Objects with the custom property; use key=value to match a value")
+        ],
+        default="NAME"
+    )
+    pattern: StringProperty(
+        name="Pattern",
+        default="",
+        description="Collection name, name pattern or custom property to match"
+    )
+    suffix: EnumProperty(
+        name="Suffix",
+        description="Godot suffix added to matching node names in the exported glTF",
+        items=GODOT_SUFFIX_ITEMS,
+        default="-col"
+    )
+
+class GodotExportProfile(bpy.types.PropertyGroup):
+    name: StringProperty(name="Name", default="Profile")
+    export_format: EnumProperty(
+        name="Buffers",
+        description="How geometry buffers are stored",
+        items=[
+            ("GLB", "GLB", "Single binary file with embedded buffers"),
+            # The exporter only offers GLTF_EMBEDDED when its allow_embedded_format preference is on.
+            ("GLTF_SEPARATE", "glTF + .bin", "JSON file with a separate .bin buffer")
+        ],
+        default="GLB"
+    )
+    keep_normals: BoolProperty(name="Normals", default=True, description="Export vertex normals")
+    keep_tangents: BoolProperty(name="Tangents", default=False, description="Export vertex tangents")
+    keep_uvs: BoolProperty(name="UVs", default=True, description="Export texture coordinates")
+    keep_vertex_colors: BoolProperty(name="Vertex Colors", default=True, description="Export vertex colors")
+    keep_attributes: BoolProperty(name="Custom Attributes", default=False,
+                                  description="Export custom mesh attributes")
+    keep_images: BoolProperty(name="Images", default=True,
+                              description="Write images into the glTF; off when textures come from Export Textures")
+    sample_animations: BoolProperty(
+        name="Sample Animations", default=False,
+        description="Bake one key per frame on export. Leave off to keep the keys left by Reduce Keyframes; "
+                    "turn on for animation driven by constraints or drivers")
+
 class GodotMeshProperty(bpy.types.PropertyGroup):
     prop_name: StringProperty(
         name="Property Name",
@@ -192,6 +257,8 @@ class GodotMeshProperty(bpy.types.PropertyGroup):
             ("LightMapOff", "LightMapOff", "Disable light map"),
             ("ShadowMeshesOn", "ShadowMeshesOn", "Enable shadow meshes"),
             ("ShadowMeshesOff", "ShadowMeshesOff", "Disable shadow meshes"),
+            ("LodsOn", "LodsOn", "Generate LODs on import"),
+            ("LodsOff", "LodsOff", "Skip LOD generation on import"),
             ("Custom", "Custom", "Enter custom value")
         ],
         default="Custom",
@@ -300,6 +367,419 @@ class OBJECT_OT_godot_tools(bpy.types.Operator):
             add_root_bone_and_copy_animation(armature, self.hip_bone_name, self.root_bone_name)
         return {'FINISHED'}
 
+# --- Keyframe Reduction ---
+# Bytes per key and channel in an exported glTF sampler (float32 time + float32 value).
+KEY_BYTES_PER_CHANNEL = 8
+KEY_INTERPOLATION_LINEAR = 1
+
+def channel_tolerance(data_path, tolerances):
+    """Pick the error tolerance for an F-curve from the property it animates."""
+    prop = data_path.rsplit(".", 1)[-1]
+    if prop == "location":
+        return tolerances["location"]
+    if prop.startswith("rotation"):
+        return tolerances["rotation"]
+    if prop == "scale":
+        return tolerances["scale"]
+    return tolerances["default"]
+
+def reduce_keys(frames, values, tolerance):
+    """
+    Return a mask of the keys to keep so that linear interpolation between kept keys
+    stays within tolerance of every original key. Each pass tests all interior keys at
+    once and removes every other removable one, so neighbours are never dropped together.
+    """
+    keep = np.ones(len(frames), dtype=bool)
+    removed = True
+    while removed:
+        removed = False
+        for parity in (0, 1):
+            kept = np.flatnonzero(keep)
+            if len(kept) < 3:
+                return keep
+            prev, cand, nxt = kept[:-2], kept[1:-1], kept[2:]
+            spans = nxt - prev + 1
+            offsets = np.cumsum(spans) - spans
+            seg = np.repeat(np.arange(len(cand)), spans)
+            samples = np.repeat(prev, spans) + np.arange(spans.sum()) - np.repeat(offsets, spans)
+            x0, x1 = frames[prev][seg], frames[nxt][seg]
+            y0, y1 = values[prev][seg], values[nxt][seg]
+            error = np.abs(y0 + (frames[samples] - x0) / (x1 - x0) * (y1 - y0) - values[samples])
+            removable = np.maximum.reduceat(error, offsets) <= tolerance
+            removable &= (np.arange(len(cand)) % 2) == parity
+            if removable.any():
+                keep[cand[removable]] = False
+                removed = True
+    return keep
+
+def read_keyframes(fcurve):
+    """Read all keyframe data of an F-curve into numpy arrays."""
+    points = fcurve.keyframe_points
+    count = len(points)
+    data = {
+        "co": np.empty(count * 2, dtype=np.float32),
+        "handle_left": np.empty(count * 2, dtype=np.float32),
+        "handle_right": np.empty(count * 2, dtype=np.float32),
+        "interpolation": np.empty(count, dtype=np.int32),
+        "handle_left_type": np.empty(count, dtype=np.int32),
+        "handle_right_type": np.empty(count, dtype=np.int32),
+    }
+    for attr, array in data.items():
+        points.foreach_get(attr, array)
+    return data
+
+def write_keyframes(fcurve, data):
+    """Replace all keyframes of an F-curve with the given arrays in one bulk write."""
+    points = fcurve.keyframe_points
+    points.clear()
+    points.add(len(data["interpolation"]))
+    for attr, array in data.items():
+        points.foreach_set(attr, array)
+    fcurve.update()
+
+def is_linear_safe(frames, interpolation):
+    """
+    True when linear interpolation between keys reproduces the curve the exporter samples:
+    every key is already LINEAR, or keys sit on consecutive frames (baked animation).
+    """
+    if (interpolation == KEY_INTERPOLATION_LINEAR).all():
+        return True
+    return bool((np.diff(frames) <= 1.0 + 1e-4).all())
+
+def reduce_action_keyframes(action, tolerances):
+    """
+    Drop redundant keys from every linear-safe F-curve of an action. Kept keys are set to LINEAR,
+    the interpolation the tolerance was checked against. Returns (keys_before, keys_after).
+    """
+    before = after = 0
+    for fcurve in action.fcurves:
+        count = len(fcurve.keyframe_points)
+        before += count
+        if count < 3:
+            after += count
+            continue
+        data = read_keyframes(fcurve)
+        co = data["co"].reshape(-1, 2).astype(np.float64)
+        # Bezier spans between sparse keys and constant steps cannot be rebuilt from kept keys.
+        if not is_linear_safe(co[:, 0], data["interpolation"]):
+            after += count
+            continue
+        keep = reduce_keys(co[:, 0], co[:, 1], channel_tolerance(fcurve.data_path, tolerances))
+        kept = int(keep.sum())
+        after += kept
+        if kept == count:
+            continue
+        keep2 = np.repeat(keep, 2)
+        reduced = {
+            attr: array[keep2] if array.size == count * 2 else array[keep]
+            for attr, array in data.items()
+        }
+        reduced["interpolation"][:] = KEY_INTERPOLATION_LINEAR
+        write_keyframes(fcurve, reduced)
+    return before, after
+
+class OBJECT_OT_reduce_keyframes(bpy.types.Operator):
+    """Remove keyframes that can be interpolated from their neighbours within tolerance"""
+    bl_idname = "object.reduce_keyframes"
+    bl_label = "Reduce Keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    all_actions: BoolProperty(
+        name="All Actions",
+        default=True,
+        description="Process every action in the file instead of only the selected objects' active actions"
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        scene = context.scene
+        tolerances = {
+            "location": scene.godot_anim_tolerance_location,
+            "rotation": scene.godot_anim_tolerance_rotation,
+            "scale": scene.godot_anim_tolerance_scale,
+            "default": scene.godot_anim_tolerance_default,
+        }
+        if self.all_actions:
+            actions = list(bpy.data.actions)
+        else:
+            actions = list({obj.animation_data.action for obj in context.selected_objects
+                            if obj.animation_data and obj.animation_data.action})
+        if not actions:
+            self.report({'WARNING'}, "No actions to reduce.")
+            return {'CANCELLED'}
+        total_before = total_after = 0
+        for action in actions:
+            before, after = reduce_action_keyframes(action, tolerances)
+            total_before += before
+            total_after += after
+            print(f"{action.name}: {before} -> {after} keys, "
+                  f"~{(before - after) * KEY_BYTES_PER_CHANNEL} bytes saved")
+        saved = total_before - total_after
+        # The savings only reach the glTF when it is exported without animation sampling.
+        self.report({'INFO'}, f"Removed {saved} of {total_before} keys from {len(actions)} action(s), "
+                              f"~{saved * KEY_BYTES_PER_CHANNEL // 1024} KiB saved in exports "
+                              f"with Sample Animations off.")
+        return {'FINISHED'}
+
+# --- Root Motion Extraction ---
+AXIS_INDEX = {"X": 0, "Y": 1, "Z": 2}
+
+def quat_multiply(a, b):
+    """Multiply two arrays of (w, x, y, z) quaternions row by row."""
+    aw, ax, ay, az = a.T
+    bw, bx, by, bz = b.T
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=1)
+
+def quat_conjugate(q):
+    return q * np.array([1.0, -1.0, -1.0, -1.0])
+
+def quat_rotate(q, v):
+    """Rotate an array of vectors by an array of unit quaternions."""
+    p = np.concatenate([np.zeros((len(v), 1)), v], axis=1)
+    return quat_multiply(quat_multiply(q, p), quat_conjugate(q))[:, 1:]
+
+def quat_twist(q, axis):
+    """Twist part of each quaternion around a local axis (swing-twist decomposition)."""
+    twist = np.zeros_like(q)
+    twist[:, 0] = q[:, 0]
+    twist[:, 1 + axis] = q[:, 1 + axis]
+    norm = np.linalg.norm(twist, axis=1)
+    degenerate = norm < 1e-8
+    twist[degenerate] = (1.0, 0.0, 0.0, 0.0)
+    norm[degenerate] = 1.0
+    return twist / norm[:, None]
+
+def fcurve_keys(fcurve):
+    """Return an F-curve's keyframe (frame, value) pairs as an (n, 2) array."""
+    co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+    fcurve.keyframe_points.foreach_get("co", co)
+    return co.reshape(-1, 2)
+
+def sample_fcurve(fcurve, frames):
+    """Sample an F-curve at the given frames, interpolating linearly between its keys."""
+    co = fcurve_keys(fcurve)
+    return np.interp(frames, co[:, 0], co[:, 1])
+
+def write_fcurve_samples(action, data_path, index, group, frames, values):
+    """Replace (or create) an F-curve with one key per frame, written in bulk."""
+    fcurve = action.fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = action.fcurves.new(data_path=data_path, index=index, action_group=group)
+    co = np.empty((len(frames), 2), dtype=np.float32)
+    co[:, 0] = frames
+    co[:, 1] = values
+    fcurve.keyframe_points.clear()
+    fcurve.keyframe_points.add(len(frames))
+    fcurve.keyframe_points.foreach_set("co", co.ravel())
+    fcurve.update()
+
+def ensure_root_bone(armature, hip_bone_name, root_bone_name):
+    """Create the root bone as the hip bone's parent if it does not exist yet."""
+    if root_bone_name in armature.data.bones:
+        return True
+    if hip_bone_name not in armature.data.bones:
+        print(f"{hip_bone_name} not found in {armature.name}")
+        return False
+    bpy.context.view_layer.objects.active = armature
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = armature.data.edit_bones
+    hips_bone = edit_bones[hip_bone_name]
+    root_bone = edit_bones.new(root_bone_name)
+    root_bone.head = hips_bone.head.copy()
+    root_bone.tail = hips_bone.tail.copy()
+    root_bone.roll = hips_bone.roll
+    hips_bone.parent = root_bone
+    bpy.ops.object.mode_set(mode='OBJECT')
+    armature.pose.bones[root_bone_name].rotation_mode = 'QUATERNION'
+    return True
+
+def extract_root_motion(action, hip_bone_name, root_bone_name, up_axis, include_vertical, extract_yaw):
+    """
+    Move the hip's ground-plane translation (and optionally its vertical translation and yaw)
+    onto the root bone. The root bone shares the hip's rest pose, so the hip keeps
+    inverse(yaw) * (location - root location) and inverse(yaw) * rotation.
+    Returns False when the action has no hip location curves or was already processed.
+    """
+    hip_loc_path = f'pose.bones["{hip_bone_name}"].location'
+    hip_rot_path = f'pose.bones["{hip_bone_name}"].rotation_quaternion'
+    root_loc_path = f'pose.bones["{root_bone_name}"].location'
+    root_rot_path = f'pose.bones["{root_bone_name}"].rotation_quaternion'
+    fcurves = action.fcurves
+    if any(fc.data_path.startswith(f'pose.bones["{root_bone_name}"]') for fc in fcurves):
+        return False
+    loc_curves = [fcurves.find(hip_loc_path, index=i) for i in range(3)]
+    if not any(loc_curves):
+        return False
+    rot_curves = [fcurves.find(hip_rot_path, index=i) for i in range(4)] if extract_yaw else []
+    if extract_yaw and not all(rot_curves):
+        print(f"{action.name}: no quaternion rotation on {hip_bone_name}, yaw not extracted")
+        extract_yaw = False
+
+    curves = [fc for fc in loc_curves + rot_curves if fc]
+    frames = np.unique(np.concatenate([fcurve_keys(fc)[:, 0] for fc in curves]))
+    location = np.stack([sample_fcurve(fc, frames) if fc else np.zeros(len(frames)) for fc in loc_curves], axis=1)
+
+    up = AXIS_INDEX[up_axis]
+    axes = [i for i in range(3) if i != up or include_vertical]
+    root_location = np.zeros_like(location)
+    root_location[:, axes] = location[:, axes]
+    residual = location - root_location
+
+    for axis in axes:
+        write_fcurve_samples(action, root_loc_path, axis, root_bone_name, frames, root_location[:, axis])
+    if extract_yaw:
+        rotation = np.stack([sample_fcurve(fc, frames) for fc in rot_curves], axis=1)
+        rotation /= np.linalg.norm(rotation, axis=1)[:, None]
+        yaw = quat_twist(rotation, up)
+        inverse_yaw = quat_conjugate(yaw)
+        residual = quat_rotate(inverse_yaw, residual)
+        hip_rotation = quat_multiply(inverse_yaw, rotation)
+        for i in range(4):
+            write_fcurve_samples(action, root_rot_path, i, root_bone_name, frames, yaw[:, i])
+            write_fcurve_samples(action, hip_rot_path, i, hip_bone_name, frames, hip_rotation[:, i])
+        for i in range(3):
+            write_fcurve_samples(action, hip_loc_path, i, hip_bone_name, frames, residual[:, i])
+    else:
+        # Without yaw the extracted axes leave nothing behind on the hip. A flat zero curve (rather than
+        # no curve) keeps every armature using the action from holding the last evaluated hip offset.
+        ends = np.unique(frames[[0, -1]])
+        for axis in axes:
+            if loc_curves[axis]:
+                write_fcurve_samples(action, hip_loc_path, axis, hip_bone_name, ends, np.zeros(len(ends)))
+    return True
+
+def extract_root_motion_all(armatures, options):
+    """Prepare the root bone on each armature, then extract root motion from every action in the file."""
+    hip, root = options["hip_bone_name"], options["root_bone_name"]
+    for armature in armatures:
+        ensure_root_bone(armature, hip, root)
+    hip_prefix = f'pose.bones["{hip}"]'
+    processed = 0
+    for action in bpy.data.actions:
+        if not any(fc.data_path.startswith(hip_prefix) for fc in action.fcurves):
+            continue
+        if extract_root_motion(action, hip, root, options["up_axis"],
+                               options["include_vertical"], options["extract_yaw"]):
+            processed += 1
+    return processed
+
+def run_root_motion_worker(argv):
+    """Entry point of a headless worker: blender -b file.blend --python BlenGo.py -- --blengo-root-motion '<json>'"""
+    options = json.loads(argv[argv.index("--blengo-root-motion") + 1])
+    armatures = [obj for obj in bpy.data.objects if obj.type == 'ARMATURE']
+    processed = extract_root_motion_all(armatures, options)
+    bpy.ops.wm.save_mainfile()
+    print(f"BlenGo: extracted root motion from {processed} action(s) in {bpy.data.filepath}")
+
+def run_root_motion_workers(filepaths, options, max_workers):
+    """Process .blend files in parallel background Blender instances. Returns [(filepath, returncode, stderr)]."""
+    script = os.path.abspath(__file__)
+
+    def run(filepath):
+        # Without --python-exit-code Blender exits with 0 even when the worker script raises.
+        cmd = [bpy.app.binary_path, "--factory-startup", "-b", filepath, "--python-exit-code", "1",
+               "--python", script, "--", "--blengo-root-motion", json.dumps(options)]
+        result = subprocess.run(cmd, capture_output=True, text=True, errors="replace")
+        return filepath, result.returncode, result.stderr
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, filepaths))
+
+class RootMotionOptions:
+    hip_bone_name: StringProperty(
+        name="Hip Bone Name",
+        default="mixamorig:Hips",
+        description="Name of the hip bone that currently carries the motion"
+    )
+    root_bone_name: StringProperty(
+        name="Root Bone Name",
+        default="root_bone",
+        description="Name of the root bone that receives the root motion"
+    )
+    up_axis: EnumProperty(
+        name="Up Axis",
+        description="Local hip bone axis that points up; the other two form the ground plane",
+        items=[("X", "X", "Bone X axis"), ("Y", "Y", "Bone Y axis"), ("Z", "Z", "Bone Z axis")],
+        default="Y"
+    )
+    include_vertical: BoolProperty(
+        name="Include Vertical",
+        default=False,
+        description="Also move vertical translation to the root bone instead of keeping bobbing on the hip"
+    )
+    extract_yaw: BoolProperty(
+        name="Extract Yaw",
+        default=False,
+        description="Move the hip's rotation around the up axis to the root bone"
+    )
+
+    def root_motion_options(self):
+        return {
+            "hip_bone_name": self.hip_bone_name,
+            "root_bone_name": self.root_bone_name,
+            "up_axis": self.up_axis,
+            "include_vertical": self.include_vertical,
+            "extract_yaw": self.extract_yaw,
+        }
+
+class OBJECT_OT_extract_root_motion(RootMotionOptions, bpy.types.Operator):
+    """Extract root motion from every action in the file onto a root bone"""
+    bl_idname = "object.extract_root_motion"
+    bl_label = "Extract Root Motion"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        selected_armatures = [obj for obj in context.selected_objects if obj.type == 'ARMATURE']
+        if not selected_armatures:
+            self.report({'WARNING'}, "No armatures selected.")
+            return {'CANCELLED'}
+        processed = extract_root_motion_all(selected_armatures, self.root_motion_options())
+        self.report({'INFO'}, f"Extracted root motion from {processed} action(s).")
+        return {'FINISHED'}
+
+class OBJECT_OT_batch_root_motion_files(RootMotionOptions, bpy.types.Operator, ImportHelper):
+    """Extract root motion in other .blend files using parallel background Blender instances"""
+    bl_idname = "object.batch_root_motion_files"
+    bl_label = "Batch Root Motion"
+
+    filename_ext = ".blend"
+    filter_glob: StringProperty(default="*.blend", options={'HIDDEN'})
+    files: CollectionProperty(type=bpy.types.OperatorFileListElement, options={'HIDDEN', 'SKIP_SAVE'})
+    directory: StringProperty(subtype='DIR_PATH')
+    workers: IntProperty(
+        name="Workers",
+        default=max(1, (os.cpu_count() or 2) // 2),
+        min=1,
+        description="Number of Blender instances running at the same time"
+    )
+
+    def execute(self, context):
+        filepaths = [os.path.join(self.directory, f.name) for f in self.files if f.name]
+        if not filepaths:
+            self.report({'WARNING'}, "No .blend files selected.")
+            return {'CANCELLED'}
+        results = run_root_motion_workers(filepaths, self.root_motion_options(), self.workers)
+        failed = []
+        for path, code, stderr in results:
+            if code != 0:
+                failed.append(os.path.basename(path))
+                print(f"BlenGo: root motion failed for {path} (exit code {code}):\n{stderr}")
+        if failed:
+            self.report({'WARNING'}, f"Root motion failed for: {', '.join(failed)} (see the console for errors)")
+        else:
+            self.report({'INFO'}, f"Extracted root motion in {len(results)} file(s).")
+        return {'FINISHED'}
+
 # --- Suffix Tools ---
 class OBJECT_OT_suffix_tools_add(bpy.types.Operator):
     """Add the selected suffix to the object's name"""
@@ -310,7 +790,7 @@ class OBJECT_OT_suffix_tools_add(bpy.types.Operator):
     def execute(self, context):
         suffix = context.scene.godot_suffix
         for obj in context.selected_objects:
-            if suffix not in obj.name:
+            if not obj.name.endswith(suffix):
                 obj.name += suffix
         self.report({'INFO'}, f"Added '{suffix}' to object names.")
         return {'FINISHED'}
@@ -324,10 +804,76 @@ class OBJECT_OT_suffix_tools_remove(bpy.types.Operator):
     def execute(self, context):
         suffix = context.scene.godot_suffix
         for obj in context.selected_objects:
-            obj.name = obj.name.replace(suffix, "")
+            if obj.name.endswith(suffix):
+                obj.name = obj.name[:-len(suffix)]
         self.report({'INFO'}, f"Removed '{suffix}' from object names.")
         return {'FINISHED'}
 
+class OBJECT_OT_add_suffix_rule(bpy.types.Operator):
+    """Add a rule that assigns a Godot suffix at export time"""
+    bl_idname = "object.add_suffix_rule"
+    bl_label = "Add Suffix Rule"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        rule = context.scene.godot_suffix_rules.add()
+        rule.suffix = context.scene.godot_suffix
+        return {'FINISHED'}
+
+class OBJECT_OT_delete_suffix_rule(bpy.types.Operator):
+    """Delete a suffix rule"""
+    bl_idname = "object.delete_suffix_rule"
+    bl_label = "Delete Suffix Rule"
+    bl_options = {'REGISTER', 'UNDO'}
+    index: IntProperty()
+
+    def execute(self, context):
+        rules = context.scene.godot_suffix_rules
+        if not 0 <= self.index < len(rules):
+            self.report({'WARNING'}, "Suffix rule not found.")
+            return {'CANCELLED'}
+        rules.remove(self.index)
+        return {'FINISHED'}
+
+def compile_suffix_rules(scene):
+    """
+    Turn the scene's suffix rules into (predicate, suffix) pairs.
+    Collection membership is resolved once here so matching a node is a set lookup.
+    """
+    compiled = []
+    for rule in scene.godot_suffix_rules:
+        pattern = rule.pattern.strip()
+        if not pattern:
+            continue
+        if rule.match_type == 'COLLECTION':
+            collection = bpy.data.collections.get(pattern)
+            if collection is None:
+                continue
+            members = {obj.name for obj in collection.all_objects}
+            compiled.append((lambda obj, members=members: obj.name in members, rule.suffix))
+        elif rule.match_type == 'NAME':
+            regex = re.compile(fnmatch.translate(pattern))
+            compiled.append((lambda obj, regex=regex: regex.match(obj.name) is not None, rule.suffix))
+        else:
+            key, sep, value = pattern.partition("=")
+            key, value = key.strip(), value.strip()
+            compiled.append((lambda obj, key=key, sep=sep, value=value:
+                             key in obj and (not sep or str(obj[key]) == value), rule.suffix))
+    return compiled
+
+def resolve_godot_suffix(obj, rules):
+    """Return the suffix of the first rule matching obj, or an empty string."""
+    for matches, suffix in rules:
+        if matches(obj):
+            return suffix
+    return ""
+
+def apply_godot_suffix(name, suffix):
+    """Append suffix to name unless the name already carries a Godot suffix."""
+    if not suffix or name.endswith(GODOT_SUFFIXES):
+        return name
+    return name + suffix
+
 def get_suffix_description(suffix):
     descriptions = {
         "-navmesh": "Suffix '-navmesh' is used for navigation mesh objects.",
@@ -366,6 +912,234 @@ class OBJECT_OT_add_collision(bpy.types.Operator):
         self.report({'INFO'}, "Added collision objects for selected objects.")
         return {'FINISHED'}
 
+# --- LOD Generation ---
+def mesh_geometry_hash(mesh):
+    """Hash of a mesh's vertex positions and face layout, used to skip regenerating unchanged data."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    digest = hashlib.sha1(co.tobytes())
+    digest.update(loop_vertices.tobytes())
+    digest.update(loop_totals.tobytes())
+    return digest.hexdigest()
+
+def parse_lod_ratios(text):
+    """Parse a comma separated list of decimation ratios, e.g. "0.5, 0.25, 0.1"."""
+    ratios = []
+    for part in text.split(","):
+        part = part.strip()
+        if part:
+            ratio = float(part)
+            if not 0.0 < ratio < 1.0:
+                raise ValueError(f"LOD ratio {ratio} must be between 0 and 1")
+            ratios.append(ratio)
+    return ratios
+
+def decimated_mesh(context, mesh, ratio, name):
+    """Return a new mesh with mesh decimated to ratio of its faces."""
+    temp = bpy.data.objects.new(name, mesh)
+    context.scene.collection.objects.link(temp)
+    try:
+        modifier = temp.modifiers.new("BlenGoLOD", 'DECIMATE')
+        modifier.ratio = ratio
+        depsgraph = context.evaluated_depsgraph_get()
+        return bpy.data.meshes.new_from_object(temp.evaluated_get(depsgraph))
+    finally:
+        bpy.data.objects.remove(temp)
+
+def lod_mesh(context, mesh, level, ratio, source_hash):
+    """Decimated mesh for one LOD level, reused while the source mesh and ratio are unchanged."""
+    key = f"{source_hash}:{ratio}"
+    name = f"{mesh.name}_LOD{level}"
+    cached = bpy.data.meshes.get(name)
+    if cached and cached.get("godot_lod_source_hash") == key:
+        return cached, False
+    lod = decimated_mesh(context, mesh, ratio, name)
+    if cached:
+        cached.user_remap(lod)
+        bpy.data.meshes.remove(cached)
+    lod.name = name
+    lod["godot_lod_source_hash"] = key
+    return lod, True
+
+def visibility_range_value(begin, end):
+    """Object property value BlenGoPostImport turns into GeometryInstance3D visibility ranges."""
+    return f"visibility_range:{begin:g}:{end:g}"
+
+def build_lod_chain(context, obj, ratios, distance):
+    """Create or refresh the <name>_LOD<n> children of obj. Returns the number of meshes decimated."""
+    mesh = obj.data
+    source_hash = mesh_geometry_hash(mesh)
+    children = {child.get("godot_lod_level"): child for child in obj.children if "godot_lod_level" in child}
+    decimated = 0
+    # LOD n is shown from distance * 2^(n-1) until the next level takes over; the last level never hides.
+    ranges = [distance * 2 ** level for level in range(len(ratios) + 1)]
+    set_custom_property(obj, "blengo_lod", visibility_range_value(0.0, ranges[0]))
+    for level, ratio in enumerate(ratios, start=1):
+        lod, created = lod_mesh(context, mesh, level, ratio, source_hash)
+        decimated += created
+        child = children.pop(level, None)
+        if child is None:
+            child = bpy.data.objects.new(f"{obj.name}_LOD{level}", lod)
+            for collection in obj.users_collection:
+                collection.objects.link(child)
+            child.parent = obj
+            child["godot_lod_level"] = level
+        child.data = lod
+        child.matrix_parent_inverse.identity()
+        child.matrix_basis.identity()
+        end = ranges[level] if level < len(ratios) else 0.0
+        set_custom_property(child, "blengo_lod", visibility_range_value(ranges[level - 1], end))
+    for child in children.values():
+        bpy.data.objects.remove(child)
+    return decimated
+
+class OBJECT_OT_generate_lods(bpy.types.Operator):
+    """Generate decimated LOD children for the selected meshes, reusing LODs whose source mesh is unchanged"""
+    bl_idname = "object.generate_lods"
+    bl_label = "Generate LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        try:
+            ratios = parse_lod_ratios(scene.godot_lod_ratios)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if not ratios:
+            self.report({'WARNING'}, "No LOD ratios set.")
+            return {'CANCELLED'}
+        sources = [obj for obj in context.selected_objects
+                   if obj.type == 'MESH' and "godot_lod_level" not in obj and len(obj.data.polygons)]
+        if not sources:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+        decimated = 0
+        for obj in sources:
+            decimated += build_lod_chain(context, obj, ratios, scene.godot_lod_distance)
+        self.report({'INFO'}, f"Updated LODs for {len(sources)} object(s), decimated {decimated} mesh(es).")
+        return {'FINISHED'}
+
+class OBJECT_OT_clear_lods(bpy.types.Operator):
+    """Remove the generated LOD children of the selected objects"""
+    bl_idname = "object.clear_lods"
+    bl_label = "Clear LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        removed = 0
+        for obj in context.selected_objects:
+            for child in [child for child in obj.children if "godot_lod_level" in child]:
+                bpy.data.objects.remove(child)
+                removed += 1
+            if "blengo_lod" in obj:
+                del obj["blengo_lod"]
+            if "_RNA_UI" in obj and "blengo_lod" in obj["_RNA_UI"]:
+                del obj["_RNA_UI"]["blengo_lod"]
+        self.report({'INFO'}, f"Removed {removed} LOD object(s).")
+        return {'FINISHED'}
+
+# --- Lightmap UV Generation ---
+LIGHTMAP_UV_NAME = "LightmapUV"
+
+def wants_lightmap_uv(mesh):
+    """True when the mesh carries a blengo_mesh property set to LightMapOn."""
+    return any(key.startswith("blengo_mesh:") and mesh[key] == "LightMapOn" for key in mesh.keys())
+
+def has_baked_lightmap_uv(mesh):
+    """True when the mesh's second UV layer is an up to date BlenGo lightmap unwrap."""
+    layers = mesh.uv_layers
+    return (len(layers) > 1 and layers[1].name == LIGHTMAP_UV_NAME
+            and mesh.get("godot_lightmap_uv_hash") == mesh_geometry_hash(mesh))
+
+def generate_lightmap_uvs(context, objects):
+    """
+    Unwrap a LightmapUV layer (exported as UV2) for every LightMapOn mesh used by objects.
+    Meshes whose geometry hash matches the last unwrap are left untouched.
+    Returns (number of meshes unwrapped, names of meshes that were skipped).
+    """
+    targets = {}
+    skipped = []
+    for obj in objects:
+        mesh = obj.data if obj.type == 'MESH' else None
+        if mesh is None or mesh in targets or mesh.library or not wants_lightmap_uv(mesh):
+            continue
+        source_hash = mesh_geometry_hash(mesh)
+        layer = mesh.uv_layers.get(LIGHTMAP_UV_NAME)
+        if layer and mesh.get("godot_lightmap_uv_hash") == source_hash:
+            continue
+        if not layer:
+            if len(mesh.uv_layers) == 0:
+                mesh.uv_layers.new(name="UVMap")
+            if len(mesh.uv_layers) > 1:
+                # glTF exports UV layers in order, so UV2 has to be the second layer.
+                skipped.append(mesh.name)
+                continue
+            layer = mesh.uv_layers.new(name=LIGHTMAP_UV_NAME, do_init=False)
+        elif mesh.uv_layers[1] != layer:
+            skipped.append(mesh.name)
+            continue
+        # Cleared first, so stale UVs from an older unwrap can't pass for a fresh one below.
+        layer.data.foreach_set("uv", np.zeros(len(mesh.loops) * 2, dtype=np.float32))
+        targets[mesh] = (source_hash, mesh.uv_layers.active_index)
+        mesh.uv_layers.active = layer
+    if not targets:
+        return 0, skipped
+
+    if context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    # Unwrap through temporary objects handed to the operator directly, so meshes whose objects
+    # are hidden or unselectable are packed too and the user's selection is never touched.
+    temps = []
+    try:
+        for mesh in targets:
+            temp = bpy.data.objects.new("BlenGoLightmapUV", mesh)
+            context.scene.collection.objects.link(temp)
+            temps.append(temp)
+        with context.temp_override(object=temps[0], active_object=temps[0], selected_objects=temps,
+                                   selected_editable_objects=temps):
+            bpy.ops.uv.lightmap_pack(PREF_CONTEXT='ALL_FACES', PREF_PACK_IN_ONE=False, PREF_NEW_UVLAYER=False)
+    finally:
+        for temp in temps:
+            bpy.data.objects.remove(temp)
+        for mesh, (_, active_index) in targets.items():
+            mesh.uv_layers.active_index = active_index
+    unwrapped = 0
+    for mesh, (source_hash, _) in targets.items():
+        # Only meshes the operator actually packed are marked as baked.
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers[LIGHTMAP_UV_NAME].data.foreach_get("uv", uvs)
+        if uvs.any():
+            mesh["godot_lightmap_uv_hash"] = source_hash
+            unwrapped += 1
+        else:
+            skipped.append(mesh.name)
+    return unwrapped, skipped
+
+def report_lightmap_uvs(operator, unwrapped, skipped):
+    if skipped:
+        operator.report({'WARNING'}, "Lightmap UV2 not generated (second UV map already in use, or the unwrap "
+                                     "produced nothing): " + ", ".join(skipped))
+    elif unwrapped:
+        operator.report({'INFO'}, f"Generated lightmap UV2 for {unwrapped} mesh(es).")
+
+class OBJECT_OT_generate_lightmap_uvs(bpy.types.Operator):
+    """Unwrap lightmap UV2 for LightMapOn meshes in the scene whose geometry changed since the last unwrap"""
+    bl_idname = "object.generate_lightmap_uvs"
+    bl_label = "Generate Lightmap UVs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        unwrapped, skipped = generate_lightmap_uvs(context, context.view_layer.objects)
+        report_lightmap_uvs(self, unwrapped, skipped)
+        if not unwrapped and not skipped:
+            self.report({'INFO'}, "Lightmap UVs are up to date.")
+        return {'FINISHED'}
+
 # --- Asset Folder & Texture Export ---
 class OBJECT_OT_set_asset_folder_path(bpy.types.Operator, ImportHelper):
     """Set the asset folder path for the Godot project."""
@@ -423,6 +1197,211 @@ class OBJECT_OT_set_asset_folder_path(bpy.types.Operator, ImportHelper):
         self.report({'INFO'}, "Asset folders created and saved")
         return {'FINISHED'}
 
+# Formats Godot imports directly, so their original bytes can be copied as they are.
+GODOT_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".tga", ".bmp", ".exr", ".hdr", ".dds", ".ktx", ".svg"}
+PACKED_IMAGE_EXTENSIONS = {
+    'PNG': ".png", 'JPEG': ".jpg", 'TARGA': ".tga", 'TARGA_RAW': ".tga",
+    'BMP': ".bmp", 'OPEN_EXR': ".exr", 'HDR': ".hdr", 'WEBP': ".webp",
+}
+
+def texture_copy_extension(img):
+    """Extension of the image's original bytes if Godot can import them unchanged, else None."""
+    if img.packed_file:
+        return PACKED_IMAGE_EXTENSIONS.get(img.file_format)
+    if img.source != 'FILE' or not img.filepath:
+        return None
+    ext = os.path.splitext(img.filepath)[1].lower()
+    if ext in GODOT_IMAGE_EXTENSIONS and os.path.isfile(bpy.path.abspath(img.filepath, library=img.library)):
+        return ext
+    return None
+
+def texture_export_filename(img, rescale=False):
+    """File name an image gets in the textures folder; re-encoded images are always PNG."""
+    if img.filepath:
+        filename = os.path.basename(img.filepath)
+    elif os.path.splitext(img.name)[1].lower() in GODOT_IMAGE_EXTENSIONS:
+        filename = img.name
+    else:
+        filename = img.name + ".png"
+    copy_ext = None if rescale else texture_copy_extension(img)
+    stem, ext = os.path.splitext(filename)
+    if copy_ext:
+        return filename if ext.lower() in GODOT_IMAGE_EXTENSIONS else stem + copy_ext
+    return stem + ".png"
+
+def copy_texture_file(src, dst, hardlink=True):
+    """Hardlink src to dst when both are on the same filesystem, otherwise copy the bytes."""
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return
+        os.remove(dst)
+    if hardlink and os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    with replaced_file(dst) as tmp_path:
+        shutil.copyfile(src, tmp_path)
+
+def export_texture_image(img, out_filepath, resolution=None, hardlink=True):
+    """Write img to out_filepath, reusing the original bytes whenever no rescale is needed."""
+    if resolution is None and texture_copy_extension(img):
+        if img.packed_file:
+            write_bytes_file(out_filepath, img.packed_file.data)
+        else:
+            copy_texture_file(bpy.path.abspath(img.filepath, library=img.library), out_filepath, hardlink)
+        return
+    # Re-encode a copy so the source image keeps its format.
+    new_img = img.copy()
+    try:
+        if resolution:
+            new_img.scale(resolution, resolution)
+        new_img.file_format = 'PNG'
+        with replaced_file(out_filepath) as tmp_path:
+            new_img.save_render(tmp_path)
+    finally:
+        bpy.data.images.remove(new_img)
+
+def encode_png(width, height, channels, pixels):
+    """Encode Blender float pixels (bottom row first, 3 or 4 channels) as 8-bit PNG bytes."""
+    rows = (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8).reshape(height, width * channels)[::-1]
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 1:] = rows
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+    color_type = 6 if channels == 4 else 2
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)) + chunk(b"IEND", b""))
+
+@contextmanager
+def replaced_file(path):
+    """
+    Yield a temporary path next to path and move it over path on success.
+    An earlier export may have left path hardlinked to the artist's source texture, so writing
+    in place would change the source too; replacing the directory entry never touches that inode.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".blengo-", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def write_bytes_file(path, data):
+    with replaced_file(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+def gather_texture_export(img, out_filepath, resolution=None, hardlink=True):
+    """
+    Do the Blender-side part of exporting img and return a callable that finishes it.
+    The callable only does encoding and file I/O, so it is safe to run off the main thread.
+    """
+    if resolution is None and texture_copy_extension(img):
+        if img.packed_file:
+            data = bytes(img.packed_file.data)
+            return lambda: write_bytes_file(out_filepath, data)
+        src = bpy.path.abspath(img.filepath, library=img.library)
+        return lambda: copy_texture_file(src, out_filepath, hardlink)
+    if img.is_float or img.channels not in {3, 4}:
+        # High dynamic range and unusual layouts go through Blender's own writer.
+        export_texture_image(img, out_filepath, resolution, hardlink)
+        return None
+    source = img.copy() if resolution else img
+    try:
+        if resolution:
+            source.scale(resolution, resolution)
+        width, height = source.size
+        channels = source.channels
+        pixels = np.empty(width * height * channels, dtype=np.float32)
+        source.pixels.foreach_get(pixels)
+    finally:
+        if source is not img:
+            bpy.data.images.remove(source)
+    return lambda: write_bytes_file(out_filepath, encode_png(width, height, channels, pixels))
+
+# Godot texture importer settings per texture role. Writing them before Godot first sees a texture
+# means it is imported once with the right settings, and detect_3d never triggers a second import.
+TEXTURE_IMPORT_ROLES = {
+    # Colour data stays sRGB friendly; normal maps get RGTC-style compression; everything else packs freely.
+    "COLOR": {"compress/normal_map": 2, "compress/channel_pack": 0},
+    "NORMAL": {"compress/normal_map": 1, "compress/channel_pack": 1},
+    "DATA": {"compress/normal_map": 2, "compress/channel_pack": 1},
+}
+COLOR_SOCKETS = {"Base Color", "Emission Color", "Emission", "Subsurface Color", "Specular Tint", "Sheen Tint"}
+
+def _image_node_role(node_tree, node):
+    """Role of an image node from what it feeds: a Normal Map node, a colour input, or anything else."""
+    targets = [link.to_socket for link in node_tree.links if link.from_node == node]
+    while targets:
+        socket = targets.pop()
+        if socket.node.type == 'REROUTE':
+            targets.extend(link.to_socket for link in node_tree.links if link.from_node == socket.node)
+        elif socket.node.type == 'NORMAL_MAP':
+            return "NORMAL"
+        elif socket.name in COLOR_SOCKETS:
+            return "COLOR"
+    return "DATA" if node.image.colorspace_settings.name == 'Non-Color' else "COLOR"
+
+def detect_texture_roles(materials):
+    """Map image names to COLOR, NORMAL or DATA from how the material node graphs use them."""
+    priority = {"NORMAL": 2, "COLOR": 1, "DATA": 0}
+    roles = {}
+    for mat in materials:
+        if not mat.use_nodes or not mat.node_tree:
+            continue
+        for node in mat.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image:
+                role = _image_node_role(mat.node_tree, node)
+                current = roles.get(node.image.name)
+                if current is None or priority[role] > priority[current]:
+                    roles[node.image.name] = role
+    return roles
+
+def texture_import_file(texture_path, role, project_root):
+    """
+    (path, text) of a Godot .import file for texture_path, or None when one already exists
+    or the project root is unknown. Existing files are left alone so settings tweaked in Godot survive.
+    """
+    import_path = texture_path + ".import"
+    if not project_root or os.path.exists(import_path):
+        return None
+    params = {
+        "compress/mode": 2,
+        "compress/high_quality": False,
+        "compress/lossy_quality": 0.7,
+        "compress/hdr_compression": 1,
+        "compress/normal_map": 0,
+        "compress/channel_pack": 0,
+        "mipmaps/generate": True,
+        "mipmaps/limit": -1,
+        "roughness/mode": 0,
+        "roughness/src_normal": "",
+        "process/fix_alpha_border": True,
+        "process/premult_alpha": False,
+        "process/normal_map_invert_y": False,
+        "process/hdr_as_srgb": False,
+        "process/size_limit": 0,
+        "detect_3d/compress_to": 0,
+    }
+    params.update(TEXTURE_IMPORT_ROLES.get(role, TEXTURE_IMPORT_ROLES["COLOR"]))
+    lines = ["[remap]", "", 'importer="texture"', 'type="CompressedTexture2D"', "",
+             "[deps]", "", f'source_file="{compute_godot_relative_path(texture_path, project_root)}"', "",
+             "[params]", ""]
+    for key, value in params.items():
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif isinstance(value, str):
+            value = f'"{value}"'
+        lines.append(f"{key}={value}")
+    return import_path, "\n".join(lines) + "\n"
+
 class OBJECT_OT_export_textures(bpy.types.Operator):
     """Export all textures used in the blend file to the textures folder."""
     bl_idname = "object.export_textures"
@@ -437,27 +1416,117 @@ class OBJECT_OT_export_textures(bpy.types.Operator):
             return {'CANCELLED'}
         rescale = scene.godot_texture_rescale
         resolution = int(scene.godot_texture_resolution) if rescale else None
+        roles = detect_texture_roles(bpy.data.materials)
+        project_root = bpy.path.abspath(scene.godot_project_root)
         exported = 0
         for img in bpy.data.images:
             if img.users > 0 and (img.filepath or img.packed_file):
-                filename = os.path.basename(img.filepath) if img.filepath else img.name + ".png"
-                out_filepath = os.path.join(textures_folder, filename)
+                out_filepath = os.path.join(textures_folder, texture_export_filename(img, rescale))
+                import_file = texture_import_file(out_filepath, roles.get(img.name), project_root)
                 try:
-                    if rescale and resolution:
-                        new_img = img.copy()
-                        new_img.scale(resolution, resolution)
-                        new_img.file_format = 'PNG'
-                        new_img.save_render(out_filepath)
-                        bpy.data.images.remove(new_img)
-                    else:
-                        img.file_format = 'PNG'
-                        img.save_render(out_filepath)
+                    if import_file:
+                        write_text_file(*import_file)
+                    writer = gather_texture_export(img, out_filepath, resolution, scene.godot_texture_hardlink)
+                    if writer:
+                        writer()
                     exported += 1
                 except Exception as e:
+                    # Never leave a .import behind without its texture.
+                    if import_file and not os.path.exists(out_filepath):
+                        discard_file(import_file[0])
                     self.report({'WARNING'}, f"Could not export {img.name}: {str(e)}")
         self.report({'INFO'}, f"Exported {exported} texture(s) to {textures_folder}")
         return {'FINISHED'}
 
+# --- Export Profiles ---
+def gltf_exporter_properties():
+    """Names of the keyword arguments the installed glTF exporter accepts."""
+    return {prop.identifier for prop in bpy.ops.export_scene.gltf.get_rna_type().properties}
+
+def resolve_export_profile(scene, collection=None):
+    """The profile set on collection, falling back to the scene's profile. None means use the exporter dialog."""
+    name = ""
+    if collection is not None:
+        name = collection.godot_export_profile
+    if not name:
+        name = scene.godot_export_profile
+    return scene.godot_export_profiles.get(name) if name else None
+
+def export_profile_settings(profile):
+    """glTF exporter keyword arguments for a profile, limited to those this Blender version supports."""
+    settings = {
+        "export_format": profile.export_format,
+        # Draco would make KHR_draco_mesh_compression a required extension, which Godot cannot import.
+        "export_draco_mesh_compression_enable": False,
+        "export_normals": profile.keep_normals,
+        "export_tangents": profile.keep_tangents,
+        "export_texcoords": profile.keep_uvs,
+        "export_attributes": profile.keep_attributes,
+        # Blender 4.2 replaced export_colors with export_vertex_color.
+        "export_colors": profile.keep_vertex_colors,
+        "export_vertex_color": 'MATERIAL' if profile.keep_vertex_colors else 'NONE',
+        "export_image_format": 'AUTO' if profile.keep_images else 'NONE',
+        # Sampling replaces reduced keys with one per frame.
+        "export_force_sampling": profile.sample_animations,
+    }
+    supported = gltf_exporter_properties()
+    return {key: value for key, value in settings.items() if key in supported}
+
+def export_profile_extension(profile):
+    return ".glb" if profile.export_format == 'GLB' else ".gltf"
+
+def exported_size(filepath):
+    """Bytes written for a glTF export, including the separate .bin buffer when there is one."""
+    size = 0
+    for path in (filepath, os.path.splitext(filepath)[0] + ".bin"):
+        if os.path.isfile(path):
+            size += os.path.getsize(path)
+    return size
+
+def format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def export_gltf_with_profile(filepath, profile, **options):
+    """Export without the dialog using profile's settings. Returns (bytes written, seconds)."""
+    settings = export_profile_settings(profile)
+    settings.update(options)
+    start = time.perf_counter()
+    bpy.ops.export_scene.gltf(filepath=filepath, **settings)
+    return exported_size(filepath), time.perf_counter() - start
+
+class OBJECT_OT_add_export_profile(bpy.types.Operator):
+    """Add a named glTF export profile to the scene"""
+    bl_idname = "object.add_export_profile"
+    bl_label = "Add Export Profile"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        profile = scene.godot_export_profiles.add()
+        profile.name = f"Profile {len(scene.godot_export_profiles)}"
+        scene.godot_export_profile = profile.name
+        return {'FINISHED'}
+
+class OBJECT_OT_delete_export_profile(bpy.types.Operator):
+    """Delete the active export profile"""
+    bl_idname = "object.delete_export_profile"
+    bl_label = "Delete Export Profile"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        index = scene.godot_export_profiles.find(scene.godot_export_profile)
+        if index < 0:
+            self.report({'WARNING'}, "Export profile not found.")
+            return {'CANCELLED'}
+        scene.godot_export_profiles.remove(index)
+        scene.godot_export_profile = ""
+        return {'FINISHED'}
+
 # --- GLTF Export ---
 class OBJECT_OT_export_gltf_fixed(bpy.types.Operator):
     """Export the scene to glTF using a preset scene folder and inject custom material extras."""
@@ -477,14 +1546,150 @@ class OBJECT_OT_export_gltf_fixed(bpy.types.Operator):
             self.report({'ERROR'}, "Please save the blend file first.")
             return {'CANCELLED'}
         blend_name = os.path.splitext(os.path.basename(blend_file))[0]
-        self.filepath = os.path.join(scene.godot_asset_scene_path, blend_name + ".gltf")
+        profile = resolve_export_profile(scene)
+        extension = export_profile_extension(profile) if profile else ".gltf"
+        self.filepath = os.path.join(scene.godot_asset_scene_path, blend_name + extension)
+        report_lightmap_uvs(self, *generate_lightmap_uvs(context, context.view_layer.objects))
+        if profile:
+            return self.execute(context)
         result = bpy.ops.export_scene.gltf('INVOKE_DEFAULT', filepath=self.filepath)
         return result
 
     def execute(self, context):
-        extras = gather_material_extras()
-        inject_extras_to_gltf(self.filepath, extras)
-        self.report({'INFO'}, "Exported glTF and injected material extras metadata.")
+        profile = resolve_export_profile(context.scene)
+        if profile:
+            size, seconds = export_gltf_with_profile(self.filepath, profile)
+        if not self.filepath.lower().endswith(".glb"):
+            extras = gather_material_extras()
+            inject_extras_to_gltf(self.filepath, extras)
+        if profile:
+            self.report({'INFO'}, f"Exported '{profile.name}': {format_size(size)} in {seconds:.2f}s")
+        else:
+            self.report({'INFO'}, "Exported glTF and injected material extras metadata.")
+        return {'FINISHED'}
+
+# --- Chunked Level Export ---
+CHUNK_MANIFEST_VERSION = 1
+
+def object_world_bounds(objects):
+    """World-space (min, max) corners of the bounding boxes of the given objects."""
+    corners = np.array([tuple(obj.matrix_world @ Vector(corner)) for obj in objects for corner in obj.bound_box])
+    return corners.min(axis=0), corners.max(axis=0)
+
+def godot_bounds(bounds_min, bounds_max):
+    """Convert Blender Z-up bounds to Godot Y-up bounds (x, z, -y)."""
+    return ([bounds_min[0], bounds_min[2], -bounds_max[1]],
+            [bounds_max[0], bounds_max[2], -bounds_min[1]])
+
+def gather_level_chunks(context, mode, cell_size):
+    """
+    Partition the view layer's top-level objects into chunks.
+    Returns {chunk name: (collection or None, [root objects])}.
+    """
+    in_view_layer = set(context.view_layer.objects)
+    roots = [obj for obj in context.scene.objects if obj.parent is None and obj in in_view_layer]
+    chunks = {}
+    if mode == 'COLLECTION':
+        seen = set()
+        for collection in context.scene.collection.children:
+            members = [obj for obj in collection.all_objects if obj.parent is None and obj in in_view_layer
+                       and obj not in seen]
+            seen.update(members)
+            if members:
+                chunks[bpy.path.clean_name(collection.name)] = (collection, members)
+        loose = [obj for obj in roots if obj not in seen]
+        if loose:
+            chunks["scene_root"] = (None, loose)
+        return chunks
+    for obj in roots:
+        bounds_min, bounds_max = object_world_bounds([obj] + list(obj.children_recursive))
+        center = (bounds_min + bounds_max) * 0.5
+        cell = (int(np.floor(center[0] / cell_size)), int(np.floor(center[1] / cell_size)))
+        chunks.setdefault(f"chunk_{cell[0]}_{cell[1]}", (None, []))[1].append(obj)
+    return chunks
+
+def export_level_chunks(context, chunks, folder):
+    """
+    Export each chunk as its own file and return the manifest entries.
+    Collection chunks use the collection's export profile when it has one, otherwise the scene's.
+    """
+    entries = []
+    in_view_layer = set(context.view_layer.objects)
+    for name, (collection, roots) in chunks.items():
+        objects = [obj for root in roots for obj in [root] + list(root.children_recursive)
+                   if obj in in_view_layer]
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in objects:
+            obj.select_set(True)
+        profile = resolve_export_profile(context.scene, collection)
+        if profile:
+            filepath = os.path.join(folder, name + export_profile_extension(profile))
+            size, seconds = export_gltf_with_profile(filepath, profile, use_selection=True)
+        else:
+            filepath = os.path.join(folder, name + ".glb")
+            start = time.perf_counter()
+            bpy.ops.export_scene.gltf(filepath=filepath, export_format='GLB', use_selection=True)
+            size, seconds = exported_size(filepath), time.perf_counter() - start
+        bounds_min, bounds_max = godot_bounds(*object_world_bounds(objects))
+        entries.append({
+            "name": name,
+            "file": os.path.basename(filepath),
+            "aabb_min": [round(float(v), 4) for v in bounds_min],
+            "aabb_max": [round(float(v), 4) for v in bounds_max],
+            "bytes": size,
+            "profile": profile.name if profile else "",
+            "seconds": round(seconds, 3),
+        })
+    return entries
+
+class OBJECT_OT_export_chunks(bpy.types.Operator):
+    """Export the level as one GLB per grid cell or collection, plus a chunk manifest for streaming"""
+    bl_idname = "object.export_chunks"
+    bl_label = "Export Chunks"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        scene = context.scene
+        if not scene.godot_asset_scene_path or not os.path.isdir(scene.godot_asset_scene_path):
+            self.report({'ERROR'}, "Scene folder not set or invalid. Please set asset folder path first.")
+            return {'CANCELLED'}
+        blend_file = bpy.data.filepath
+        if not blend_file:
+            self.report({'ERROR'}, "Please save the blend file first.")
+            return {'CANCELLED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        blend_name = os.path.splitext(os.path.basename(blend_file))[0]
+        folder = os.path.join(scene.godot_asset_scene_path, blend_name + "_chunks")
+        os.makedirs(folder, exist_ok=True)
+
+        report_lightmap_uvs(self, *generate_lightmap_uvs(context, context.view_layer.objects))
+        chunks = gather_level_chunks(context, scene.godot_chunk_mode, scene.godot_chunk_size)
+        if not chunks:
+            self.report({'WARNING'}, "Nothing to export.")
+            return {'CANCELLED'}
+        selected = list(context.selected_objects)
+        active = context.view_layer.objects.active
+        try:
+            entries = export_level_chunks(context, chunks, folder)
+        finally:
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in selected:
+                obj.select_set(True)
+            context.view_layer.objects.active = active
+
+        manifest = {
+            "version": CHUNK_MANIFEST_VERSION,
+            "mode": scene.godot_chunk_mode,
+            "cell_size": scene.godot_chunk_size,
+            "chunks": entries,
+        }
+        with open(os.path.join(folder, "chunks.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        total_size = sum(entry["bytes"] for entry in entries)
+        total_seconds = sum(entry["seconds"] for entry in entries)
+        self.report({'INFO'}, f"Exported {len(entries)} chunk(s) to {folder}: "
+                              f"{format_size(total_size)} in {total_seconds:.2f}s")
         return {'FINISHED'}
 
 # --- Custom Material, Object, and Mesh Properties ---
@@ -633,6 +1838,426 @@ def compute_godot_relative_path(target_path, project_root):
     rel_path = os.path.relpath(target_path, project_root)
     return "res://" + rel_path.replace("\\", "/")
 
+# --- Shader Graph Export ---
+class UnsupportedShaderGraph(Exception):
+    """Raised when a material's node graph uses something the shader compiler cannot translate."""
+
+# Principled BSDF inputs the compiler translates; everything else on the BSDF is ignored.
+PRINCIPLED_INPUTS = ("Base Color", "Metallic", "Roughness", "Alpha", "Normal", "Emission Color", "Emission Strength")
+SOCKET_GLSL_TYPES = {'VALUE': 'float', 'INT': 'float', 'RGBA': 'vec3', 'VECTOR': 'vec3'}
+MIX_BLEND_EXPRESSIONS = {
+    "MIX": "{b}",
+    "MULTIPLY": "{a} * {b}",
+    "ADD": "{a} + {b}",
+    "SUBTRACT": "{a} - {b}",
+    "SCREEN": "vec3(1.0) - (vec3(1.0) - {a}) * (vec3(1.0) - {b})",
+    "DIFFERENCE": "abs({a} - {b})",
+    "DARKEN": "min({a}, {b})",
+    "LIGHTEN": "max({a}, {b})",
+}
+MATH_EXPRESSIONS = {
+    "ADD": "{a} + {b}",
+    "SUBTRACT": "{a} - {b}",
+    "MULTIPLY": "{a} * {b}",
+    "DIVIDE": "({b} != 0.0 ? {a} / {b} : 0.0)",
+    "POWER": "pow({a}, {b})",
+    "MINIMUM": "min({a}, {b})",
+    "MAXIMUM": "max({a}, {b})",
+}
+# Topology hash -> (shader code, uniform slots). Materials sharing a topology compile once.
+SHADER_CACHE = {}
+
+def _socket(sockets, identifier):
+    for socket in sockets:
+        if socket.identifier == identifier:
+            return socket
+    raise UnsupportedShaderGraph(f"missing socket '{identifier}'")
+
+def _convert(expr, src_type, dst_type):
+    if src_type == dst_type:
+        return expr
+    if dst_type == 'vec3':
+        return f"vec3({expr})"
+    return f"dot({expr}, vec3(0.2126, 0.7152, 0.0722))"
+
+def collect_shader_graph(mat):
+    """
+    Return (nodes, index, links) for the part of the graph feeding the Principled BSDF.
+    Nodes are in dependency order, so equal topologies always produce the same order.
+    """
+    tree = mat.node_tree
+    output = tree.get_output_node('ALL')
+    if output is None:
+        raise UnsupportedShaderGraph("no active material output")
+    links = {(link.to_node.name, link.to_socket.identifier): link
+             for link in tree.links if link.is_valid and not link.is_muted}
+    surface = links.get((output.name, "Surface"))
+    if surface is None or surface.from_node.type != 'BSDF_PRINCIPLED':
+        raise UnsupportedShaderGraph("surface is not a Principled BSDF")
+    nodes, index = [], {}
+
+    def visit(node):
+        if node.name in index:
+            if index[node.name] is None:
+                raise UnsupportedShaderGraph("node graph contains a cycle")
+            return
+        index[node.name] = None
+        for socket in node.inputs:
+            if node.type == 'BSDF_PRINCIPLED' and socket.identifier not in PRINCIPLED_INPUTS:
+                continue
+            link = links.get((node.name, socket.identifier))
+            if link:
+                visit(link.from_node)
+        index[node.name] = len(nodes)
+        nodes.append(node)
+
+    visit(surface.from_node)
+    return nodes, index, links
+
+def _principled_features(node, links):
+    """Whether the BSDF needs alpha and emission output; decides which built-ins the shader writes."""
+    def used(identifier, unused_value):
+        return ((node.name, identifier) in links
+                or _socket(node.inputs, identifier).default_value != unused_value)
+    alpha = used("Alpha", 1.0)
+    emission = (node.name, "Emission Color") in links or used("Emission Strength", 0.0)
+    return alpha, emission
+
+def _shader_node_options(node, links):
+    """Node settings that change the generated code (as opposed to uniform values)."""
+    if node.type == 'TEX_IMAGE':
+        srgb = node.image is not None and node.image.colorspace_settings.name == 'sRGB'
+        return (srgb, node.interpolation, node.extension)
+    if node.type == 'MIX':
+        return (node.data_type, node.blend_type, node.clamp_factor, node.clamp_result, node.factor_mode)
+    if node.type == 'MATH':
+        return (node.operation, node.use_clamp)
+    if node.type == 'SEPARATE_COLOR':
+        return (node.mode,)
+    if node.type == 'MAPPING':
+        return (node.vector_type,)
+    if node.type == 'NORMAL_MAP':
+        return (node.space,)
+    if node.type == 'BSDF_PRINCIPLED':
+        return _principled_features(node, links)
+    return ()
+
+def shader_graph_topology(nodes, index, links):
+    """Hash of node types, code-affecting settings and links, independent of names and values."""
+    signature = []
+    for node in nodes:
+        linked = []
+        for socket in node.inputs:
+            link = links.get((node.name, socket.identifier))
+            if link and link.from_node.name in index:
+                linked.append((socket.identifier, index[link.from_node.name], link.from_socket.identifier))
+        signature.append((node.bl_idname, _shader_node_options(node, links), tuple(linked)))
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:16]
+
+class ShaderGraphCompiler:
+    """Translates a collected node graph into Godot spatial shader code and a list of uniform slots."""
+
+    def __init__(self, nodes, index, links):
+        self.nodes = nodes
+        self.index = index
+        self.links = links
+        self.outputs = {}
+        self.normal_maps = {}
+        self.uniforms = []
+        self.lines = []
+        # (uniform name, glsl type, slot kind, node index, socket identifier)
+        self.slots = []
+
+    def uniform(self, gtype, kind, node_index, identifier, hints=""):
+        prefix = "t" if gtype == 'sampler2D' else "u"
+        name = f"{prefix}{len(self.slots)}"
+        self.uniforms.append(f"uniform {gtype} {name}{' : ' + hints if hints else ''};")
+        self.slots.append((name, gtype, kind, node_index, identifier))
+        return name
+
+    def input_expr(self, node_index, identifier, gtype):
+        node = self.nodes[node_index]
+        link = self.links.get((node.name, identifier))
+        if link is None:
+            socket = _socket(node.inputs, identifier)
+            src_type = SOCKET_GLSL_TYPES.get(socket.type)
+            if src_type is None:
+                raise UnsupportedShaderGraph(f"unsupported socket type on {node.name}.{socket.name}")
+            return _convert(self.uniform(src_type, "input", node_index, identifier), src_type, gtype)
+        key = (self.index[link.from_node.name], link.from_socket.identifier)
+        if key not in self.outputs:
+            raise UnsupportedShaderGraph(f"unsupported output {link.from_node.name}.{link.from_socket.name}")
+        expr, src_type = self.outputs[key]
+        return _convert(expr, src_type, gtype)
+
+    def emit(self, gtype, node_index, expr):
+        var = f"n{node_index}"
+        self.lines.append(f"\t{gtype} {var} = {expr};")
+        return var
+
+    def compile_node(self, i, node):
+        kind = node.type
+        if kind == 'TEX_IMAGE':
+            srgb, interpolation, extension = _shader_node_options(node, self.links)
+            hints = ["source_color"] if srgb else []
+            hints.append("filter_nearest_mipmap" if interpolation == 'Closest' else "filter_linear_mipmap")
+            hints.append("repeat_enable" if extension == 'REPEAT' else "repeat_disable")
+            sampler = self.uniform('sampler2D', "image", i, "image", ", ".join(hints))
+            uv = "UV"
+            if (node.name, "Vector") in self.links:
+                uv = self.input_expr(i, "Vector", 'vec3') + ".xy"
+            var = self.emit("vec4", i, f"texture({sampler}, {uv})")
+            self.outputs[(i, "Color")] = (f"{var}.rgb", 'vec3')
+            self.outputs[(i, "Alpha")] = (f"{var}.a", 'float')
+        elif kind == 'RGB':
+            self.outputs[(i, "Color")] = (self.uniform('vec3', "output", i, "Color"), 'vec3')
+        elif kind == 'VALUE':
+            self.outputs[(i, "Value")] = (self.uniform('float', "output", i, "Value"), 'float')
+        elif kind in {'TEX_COORD', 'UVMAP'}:
+            self.outputs[(i, "UV")] = ("vec3(UV, 0.0)", 'vec3')
+        elif kind == 'MAPPING':
+            if node.vector_type != 'POINT':
+                raise UnsupportedShaderGraph(f"mapping type {node.vector_type}")
+            vector = self.input_expr(i, "Vector", 'vec3')
+            location = self.input_expr(i, "Location", 'vec3')
+            rotation = self.input_expr(i, "Rotation", 'vec3')
+            scale = self.input_expr(i, "Scale", 'vec3')
+            # Texture mapping only needs the rotation around Z.
+            scaled = self.emit("vec3", i, f"{vector} * {scale}")
+            self.lines.append(f"\t{scaled} = vec3(cos({rotation}.z) * {scaled}.x - sin({rotation}.z) * {scaled}.y, "
+                              f"sin({rotation}.z) * {scaled}.x + cos({rotation}.z) * {scaled}.y, {scaled}.z) + {location};")
+            self.outputs[(i, "Vector")] = (scaled, 'vec3')
+        elif kind == 'MIX':
+            self.compile_mix(i, node)
+        elif kind == 'MATH':
+            template = MATH_EXPRESSIONS.get(node.operation)
+            if template is None:
+                raise UnsupportedShaderGraph(f"math operation {node.operation}")
+            a = self.input_expr(i, node.inputs[0].identifier, 'float')
+            b = self.input_expr(i, node.inputs[1].identifier, 'float')
+            expr = template.format(a=a, b=b)
+            if node.use_clamp:
+                expr = f"clamp({expr}, 0.0, 1.0)"
+            self.outputs[(i, "Value")] = (self.emit("float", i, expr), 'float')
+        elif kind == 'SEPARATE_COLOR':
+            if node.mode != 'RGB':
+                raise UnsupportedShaderGraph(f"separate color mode {node.mode}")
+            var = self.emit("vec3", i, self.input_expr(i, "Color", 'vec3'))
+            for identifier, component in (("Red", "r"), ("Green", "g"), ("Blue", "b")):
+                self.outputs[(i, identifier)] = (f"{var}.{component}", 'float')
+        elif kind == 'INVERT':
+            fac = self.input_expr(i, "Fac", 'float')
+            color = self.input_expr(i, "Color", 'vec3')
+            self.outputs[(i, "Color")] = (self.emit("vec3", i, f"mix({color}, vec3(1.0) - {color}, {fac})"), 'vec3')
+        elif kind == 'REROUTE':
+            link = self.links.get((node.name, node.inputs[0].identifier))
+            if link is None:
+                raise UnsupportedShaderGraph(f"unconnected reroute {node.name}")
+            key = (self.index[link.from_node.name], link.from_socket.identifier)
+            if key not in self.outputs:
+                raise UnsupportedShaderGraph(f"unsupported output {link.from_node.name}.{link.from_socket.name}")
+            self.outputs[(i, node.outputs[0].identifier)] = self.outputs[key]
+        elif kind == 'NORMAL_MAP':
+            if node.space != 'TANGENT':
+                raise UnsupportedShaderGraph(f"normal map space {node.space}")
+            # Only meaningful when plugged into the BSDF normal, which writes NORMAL_MAP directly.
+            self.normal_maps[i] = (self.input_expr(i, "Color", 'vec3'), self.input_expr(i, "Strength", 'float'))
+        elif kind == 'BSDF_PRINCIPLED':
+            self.compile_principled(i, node)
+        else:
+            raise UnsupportedShaderGraph(f"unsupported node {node.bl_idname}")
+
+    def compile_mix(self, i, node):
+        if node.data_type == 'RGBA':
+            template = MIX_BLEND_EXPRESSIONS.get(node.blend_type)
+            if template is None:
+                raise UnsupportedShaderGraph(f"mix blend type {node.blend_type}")
+            gtype, suffix = 'vec3', "Color"
+        elif node.data_type in {'FLOAT', 'VECTOR'} and (node.data_type == 'FLOAT' or node.factor_mode == 'UNIFORM'):
+            template = MIX_BLEND_EXPRESSIONS["MIX"]
+            gtype, suffix = ('float', "Float") if node.data_type == 'FLOAT' else ('vec3', "Vector")
+        else:
+            raise UnsupportedShaderGraph(f"mix data type {node.data_type}")
+        factor = self.input_expr(i, "Factor_Float", 'float')
+        if node.clamp_factor:
+            factor = f"clamp({factor}, 0.0, 1.0)"
+        a = self.input_expr(i, f"A_{suffix}", gtype)
+        b = self.input_expr(i, f"B_{suffix}", gtype)
+        expr = f"mix({a}, {template.format(a=a, b=b)}, {factor})"
+        if node.data_type == 'RGBA' and node.clamp_result:
+            expr = f"clamp({expr}, 0.0, 1.0)"
+        self.outputs[(i, f"Result_{suffix}")] = (self.emit(gtype, i, expr), gtype)
+
+    def compile_principled(self, i, node):
+        alpha, emission = _principled_features(node, self.links)
+        self.lines.append(f"\tALBEDO = {self.input_expr(i, 'Base Color', 'vec3')};")
+        self.lines.append(f"\tMETALLIC = {self.input_expr(i, 'Metallic', 'float')};")
+        self.lines.append(f"\tROUGHNESS = {self.input_expr(i, 'Roughness', 'float')};")
+        if alpha:
+            self.lines.append(f"\tALPHA = {self.input_expr(i, 'Alpha', 'float')};")
+        if emission:
+            color = self.input_expr(i, "Emission Color", 'vec3')
+            strength = self.input_expr(i, "Emission Strength", 'float')
+            self.lines.append(f"\tEMISSION = {color} * {strength};")
+        link = self.links.get((node.name, "Normal"))
+        if link:
+            normal_map = self.normal_maps.get(self.index[link.from_node.name])
+            if normal_map is None:
+                raise UnsupportedShaderGraph("BSDF normal must come from a tangent space Normal Map node")
+            self.lines.append(f"\tNORMAL_MAP = {normal_map[0]};")
+            self.lines.append(f"\tNORMAL_MAP_DEPTH = {normal_map[1]};")
+
+    def compile(self):
+        for i, node in enumerate(self.nodes):
+            self.compile_node(i, node)
+        return "\n".join(
+            ["shader_type spatial;", "render_mode cull_disabled;", ""] + self.uniforms
+            + ["", "void fragment() {"] + self.lines + ["}", ""])
+
+def compile_material_shader(mat):
+    """
+    Return (topology, code, uniforms) for a material, where uniforms is a list of
+    (name, glsl type, value). Raises UnsupportedShaderGraph for graphs it cannot express.
+    """
+    nodes, index, links = collect_shader_graph(mat)
+    topology = shader_graph_topology(nodes, index, links)
+    cached = SHADER_CACHE.get(topology)
+    if cached is None:
+        compiler = ShaderGraphCompiler(nodes, index, links)
+        cached = SHADER_CACHE[topology] = (compiler.compile(), compiler.slots)
+    code, slots = cached
+    uniforms = []
+    for name, gtype, kind, node_index, identifier in slots:
+        node = nodes[node_index]
+        if kind == "image":
+            value = node.image
+        else:
+            value = _socket(node.outputs if kind == "output" else node.inputs, identifier).default_value
+        uniforms.append((name, gtype, value))
+    return topology, code, uniforms
+
+def _tres_float(value):
+    return repr(round(float(value), 6))
+
+def build_shader_material_tres(mat, materials_folder, textures_folder, project_root, rescale=False):
+    """Return (tres text, shader path, shader code) for the material's ShaderMaterial and its shared shader."""
+    topology, code, uniforms = compile_material_shader(mat)
+    shader_path = os.path.join(materials_folder, "shaders", f"blengo_{topology}.gdshader")
+
+    ext_resources = [f'[ext_resource type="Shader" path="{compute_godot_relative_path(shader_path, project_root)}" id="1"]']
+    assignments = ["shader = ExtResource(\"1\")"]
+    for name, gtype, value in uniforms:
+        if gtype == 'sampler2D':
+            if value is None:
+                continue
+            texture_path = os.path.join(textures_folder, texture_export_filename(value, rescale))
+            counter = len(ext_resources) + 1
+            ext_resources.append(f'[ext_resource type="Texture2D" '
+                                 f'path="{compute_godot_relative_path(texture_path, project_root)}" id="{counter}"]')
+            assignments.append(f'shader_parameter/{name} = ExtResource("{counter}")')
+        elif gtype == 'float':
+            assignments.append(f"shader_parameter/{name} = {_tres_float(value)}")
+        else:
+            assignments.append(f"shader_parameter/{name} = Vector3({', '.join(_tres_float(v) for v in tuple(value)[:3])})")
+
+    material_header = f'[gd_resource type="ShaderMaterial" load_steps={len(ext_resources) + 1} format=3]'
+    resource_block = "[resource]\n" + f'resource_name = "{mat.name}"'
+    content = "\n".join([material_header] + ext_resources + [resource_block] + assignments) + "\n"
+    return content, shader_path, code
+
+def build_standard_material_tres(mat, textures_folder, project_root, rescale=False):
+    """Return StandardMaterial3D .tres text for the material's texture slots, or None if it has none."""
+    base_color = metallic = roughness = normal = ""
+    for node in mat.node_tree.nodes:
+        if node.type == 'TEX_IMAGE' and node.image:
+            filename = texture_export_filename(node.image, rescale)
+            name_lower = filename.lower()
+            texture_export_path = os.path.join(textures_folder, filename)
+            godot_path = compute_godot_relative_path(texture_export_path, project_root)
+            if "base" in name_lower or "albedo" in name_lower:
+                base_color = godot_path
+            elif "metal" in name_lower:
+                metallic = godot_path
+            elif "rough" in name_lower:
+                roughness = godot_path
+            elif "normal" in name_lower:
+                normal = godot_path
+    if not (base_color or metallic or roughness or normal):
+        return None
+    
+    ext_resources, assignments = [], []
+    counter = 1
+    if base_color:
+        ext_resources.append(f'[ext_resource type="Texture2D" path="{base_color}" id="{counter}"]')
+        assignments.append(f'albedo_texture = ExtResource("{counter}")')
+        counter += 1
+    if metallic:
+        ext_resources.append(f'[ext_resource type="Texture2D" path="{metallic}" id="{counter}"]')
+        assignments.extend([f'metallic = 1.0', f'metallic_texture = ExtResource("{counter}")'])
+        counter += 1
+    if roughness:
+        ext_resources.append(f'[ext_resource type="Texture2D" path="{roughness}" id="{counter}"]')
+        assignments.append(f'roughness_texture = ExtResource("{counter}")')
+        counter += 1
+    if normal:
+        ext_resources.append(f'[ext_resource type="Texture2D" path="{normal}" id="{counter}"]')
+        assignments.extend([f'normal_enabled = true', f'normal_texture = ExtResource("{counter}")'])
+        counter += 1
+
+    material_header = f'[gd_resource type="StandardMaterial3D" load_steps=5 format=3 uid="uid://{mat.name.lower()}"]'
+    resource_block = "[resource]\n" + f'resource_name = "{mat.name}"\n' + "cull_mode = 2\n"
+    return "\n".join([material_header] + ext_resources + [resource_block] + assignments)
+
+def gather_material_files(mat, scene, materials_folder, textures_folder, project_root, report):
+    """Return {path: text} of the files exporting mat writes, or None if there is nothing to export."""
+    rescale = scene.godot_texture_rescale
+    files = {}
+    content = None
+    if scene.godot_material_export_mode == 'SHADER':
+        try:
+            content, shader_path, code = build_shader_material_tres(
+                mat, materials_folder, textures_folder, project_root, rescale)
+            files[shader_path] = code
+        except UnsupportedShaderGraph as e:
+            report({'INFO'}, f"{mat.name}: {e}; exporting as StandardMaterial3D.")
+    if content is None:
+        content = build_standard_material_tres(mat, textures_folder, project_root, rescale)
+    if content is None:
+        return None
+    files[os.path.join(materials_folder, f"{mat.name}.tres")] = content
+    return files
+
+def write_text_file(path, text):
+    """Write text to path, leaving the file untouched when it already holds that text."""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def mark_material_exported(scene, mat):
+    """Point the material's BlenGo property and the scene metadata at the generated Godot material."""
+    # Update the material's custom property using the naming convention.
+    prop_name = "blengo_material:" + mat.name
+    set_custom_property(mat, prop_name, "ExtGodotMtrl")
+    if mat.godot_material_properties:
+        mat.godot_material_properties[0].prop_option = "ExtGodotMtrl"
+        mat.godot_material_properties[0].prop_description = "ExtGodotMtrl"
+    else:
+        custom_prop = mat.godot_material_properties.add()
+        custom_prop.prop_option = "ExtGodotMtrl"
+        custom_prop.prop_description = "ExtGodotMtrl"
+
+    # Update scene metadata in the same way as in the custom property update.
+    try:
+        metadata = json.loads(scene.get("godot_material_metadata", "{}"))
+    except Exception:
+        metadata = {}
+    metadata[mat.name] = {prop_name: "ExtGodotMtrl"}
+    scene["godot_material_metadata"] = json.dumps(metadata)
+
 class OBJECT_OT_export_materials(bpy.types.Operator):
     """Export Godot materials from selected objects and update custom property to 'ExtGodotMtrl'."""
     bl_idname = "object.export_materials"
@@ -662,77 +2287,373 @@ class OBJECT_OT_export_materials(bpy.types.Operator):
         for mat in selected_materials:
             if not mat.users or not mat.use_nodes:
                 continue
-            
-            base_color = metallic = roughness = normal = ""
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    filename = os.path.basename(bpy.path.abspath(node.image.filepath))
-                    name_lower = filename.lower()
-                    texture_export_path = os.path.join(textures_folder, filename)
-                    godot_path = compute_godot_relative_path(texture_export_path, project_root)
-                    if "base" in name_lower or "albedo" in name_lower:
-                        base_color = godot_path
-                    elif "metal" in name_lower:
-                        metallic = godot_path
-                    elif "rough" in name_lower:
-                        roughness = godot_path
-                    elif "normal" in name_lower:
-                        normal = godot_path
-            if not (base_color or metallic or roughness or normal):
+            files = gather_material_files(mat, scene, materials_folder, textures_folder, project_root, self.report)
+            if files is None:
                 continue
-            
-            ext_resources, assignments = [], []
-            counter = 1
-            if base_color:
-                ext_resources.append(f'[ext_resource type="Texture2D" path="{base_color}" id="{counter}"]')
-                assignments.append(f'albedo_texture = ExtResource("{counter}")')
-                counter += 1
-            if metallic:
-                ext_resources.append(f'[ext_resource type="Texture2D" path="{metallic}" id="{counter}"]')
-                assignments.extend([f'metallic = 1.0', f'metallic_texture = ExtResource("{counter}")'])
-                counter += 1
-            if roughness:
-                ext_resources.append(f'[ext_resource type="Texture2D" path="{roughness}" id="{counter}"]')
-                assignments.append(f'roughness_texture = ExtResource("{counter}")')
-                counter += 1
-            if normal:
-                ext_resources.append(f'[ext_resource type="Texture2D" path="{normal}" id="{counter}"]')
-                assignments.extend([f'normal_enabled = true', f'normal_texture = ExtResource("{counter}")'])
-                counter += 1
-
-            material_header = f'[gd_resource type="StandardMaterial3D" load_steps=5 format=3 uid="uid://{mat.name.lower()}"]'
-            resource_block = "[resource]\n" + f'resource_name = "{mat.name}"\n' + "cull_mode = 2\n"
-            content = "\n".join([material_header] + ext_resources + [resource_block] + assignments)
-            tres_path = os.path.join(materials_folder, f"{mat.name}.tres")
             try:
-                with open(tres_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                for path, text in files.items():
+                    write_text_file(path, text)
             except Exception as e:
                 self.report({'WARNING'}, f"Could not export material {mat.name}: {e}")
                 continue
-
-            # Update the material's custom property using the naming convention.
-            prop_name = "blengo_material:" + mat.name
-            set_custom_property(mat, prop_name, "ExtGodotMtrl")
-            if mat.godot_material_properties:
-                mat.godot_material_properties[0].prop_option = "ExtGodotMtrl"
-                mat.godot_material_properties[0].prop_description = "ExtGodotMtrl"
-            else:
-                custom_prop = mat.godot_material_properties.add()
-                custom_prop.prop_option = "ExtGodotMtrl"
-                custom_prop.prop_description = "ExtGodotMtrl"
-            
-            # Update scene metadata in the same way as in the custom property update.
-            try:
-                metadata = json.loads(scene.get("godot_material_metadata", "{}"))
-            except Exception:
-                metadata = {}
-            metadata[mat.name] = {prop_name: "ExtGodotMtrl"}
-            scene["godot_material_metadata"] = json.dumps(metadata)
+            mark_material_exported(scene, mat)
         
         self.report({'INFO'}, "Exported materials and updated custom properties and scene metadata to 'ExtGodotMtrl'.")
         return {'FINISHED'}
 
+# --- Background Export Jobs ---
+def discard_file(path):
+    """Remove a file this export created, ignoring one that is already gone."""
+    if os.path.isfile(path):
+        os.remove(path)
+
+def missing_paths(paths):
+    """The paths that do not exist yet, i.e. the files an export is about to create."""
+    return [path for path in paths if not os.path.exists(path)]
+
+class ExportStage:
+    """
+    One kind of export in a job; gather(item) returns (paths, writer, on_done) or None.
+    paths lists only the files the item creates, so cancelling never deletes files that existed before.
+    Files gather creates itself go in written, since they exist even if their writer never runs.
+    """
+
+    def __init__(self, name, items, gather):
+        self.name = name
+        self.items = items
+        self.gather = gather
+        self.total = len(items)
+        self.gathered = 0
+        self.done = 0
+        self.written = []
+
+class ExportJob:
+    """
+    Background export state. Blender data is gathered in short slices on the main thread,
+    writers run on worker threads, and on_done callbacks run on the main thread once the
+    whole job has finished, so a cancelled job leaves no Blender data pointing at deleted files.
+    """
+
+    def __init__(self, stages, max_workers=4):
+        self.stages = stages
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pending = []
+        self.written = []
+        self.finished_callbacks = []
+        self.errors = []
+        self.cancelled = False
+
+    @property
+    def progress(self):
+        total = sum(stage.total for stage in self.stages)
+        return sum(stage.done for stage in self.stages) / total if total else 1.0
+
+    def tick(self, budget=0.02):
+        """Gather items until the time budget is spent, then collect finished writes. True when complete."""
+        deadline = time.perf_counter() + budget
+        for stage in self.stages:
+            while stage.gathered < stage.total and time.perf_counter() < deadline:
+                item = stage.items[stage.gathered]
+                stage.gathered += 1
+                try:
+                    result = stage.gather(item)
+                except Exception as e:
+                    self.errors.append(f"{stage.name}: {item}: {e}")
+                    result = None
+                if result is None:
+                    stage.done += 1
+                    continue
+                paths, writer, on_done = result
+                future = self.executor.submit(writer) if writer else None
+                self.pending.append((future, stage, item, paths, on_done))
+            if stage.gathered < stage.total:
+                break
+        self.collect()
+        return not self.pending and all(stage.done == stage.total for stage in self.stages)
+
+    def collect(self):
+        still_pending = []
+        for entry in self.pending:
+            future, stage, item, paths, on_done = entry
+            if future is not None and not future.done():
+                still_pending.append(entry)
+                continue
+            self.written.extend(paths)
+            error = future.exception() if future is not None else None
+            if error:
+                self.errors.append(f"{stage.name}: {item}: {error}")
+            elif on_done:
+                self.finished_callbacks.append(on_done)
+            stage.done += 1
+        self.pending = still_pending
+
+    def cancel(self):
+        """Stop queued writes, wait for running ones and delete the files this job created."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        for future, stage, item, paths, on_done in self.pending:
+            if future is None or not future.cancelled():
+                self.written.extend(paths)
+        for stage in self.stages:
+            self.written.extend(stage.written)
+        for path in self.written:
+            if os.path.isfile(path):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    self.errors.append(f"Could not remove {path}: {e}")
+
+    def close(self):
+        """Finish a completed job: wait for the workers, then run the deferred on_done callbacks."""
+        self.executor.shutdown(wait=True)
+        for on_done in self.finished_callbacks:
+            on_done()
+        self.finished_callbacks = []
+
+_export_job = None
+
+def texture_export_stage(scene, textures_folder):
+    rescale = scene.godot_texture_rescale
+    resolution = int(scene.godot_texture_resolution) if rescale else None
+    hardlink = scene.godot_texture_hardlink
+    project_root = bpy.path.abspath(scene.godot_project_root)
+    names = [img.name for img in bpy.data.images if img.users > 0 and (img.filepath or img.packed_file)]
+    roles = detect_texture_roles(bpy.data.materials)
+
+    def gather(name):
+        img = bpy.data.images.get(name)
+        if img is None:
+            return None
+        out_filepath = os.path.join(textures_folder, texture_export_filename(img, rescale))
+        paths = missing_paths([out_filepath])
+        import_file = texture_import_file(out_filepath, roles.get(name), project_root)
+        if import_file:
+            # Written before the texture so Godot never sees the texture without it.
+            write_text_file(*import_file)
+            stage.written.append(import_file[0])
+        try:
+            writer = gather_texture_export(img, out_filepath, resolution, hardlink)
+        except Exception:
+            if import_file and not os.path.exists(out_filepath):
+                discard_file(import_file[0])
+                stage.written.remove(import_file[0])
+            raise
+        if writer and import_file:
+            texture_writer = writer
+
+            def writer():
+                try:
+                    texture_writer()
+                except Exception:
+                    if not os.path.exists(out_filepath):
+                        discard_file(import_file[0])
+                    raise
+
+        return paths, writer, None
+
+    stage = ExportStage("Textures", names, gather)
+    return stage
+
+def material_export_stage(scene, materials, materials_folder, textures_folder, project_root):
+    names = [mat.name for mat in materials if mat.users and mat.use_nodes]
+
+    def report(level, message):
+        print(f"BlenGo: {message}")
+
+    def gather(name):
+        mat = bpy.data.materials.get(name)
+        if mat is None:
+            return None
+        files = gather_material_files(mat, scene, materials_folder, textures_folder, project_root, report)
+        if files is None:
+            return None
+
+        def writer():
+            for path, text in files.items():
+                write_text_file(path, text)
+
+        def on_done():
+            mat = bpy.data.materials.get(name)
+            if mat:
+                mark_material_exported(scene, mat)
+
+        return missing_paths(files), writer, on_done
+
+    return ExportStage("Materials", names, gather)
+
+class OBJECT_OT_export_job(bpy.types.Operator):
+    """Export textures and materials in the background with progress and cancel"""
+    bl_idname = "object.export_job"
+    bl_label = "Background Export"
+
+    export_textures: BoolProperty(name="Textures", default=True)
+    export_materials: BoolProperty(name="Materials", default=True)
+
+    _timer = None
+
+    def invoke(self, context, event):
+        global _export_job
+        if _export_job is not None:
+            self.report({'WARNING'}, "A BlenGo export is already running.")
+            return {'CANCELLED'}
+        scene = context.scene
+        textures_folder = scene.godot_asset_textures_path
+        materials_folder = scene.godot_asset_materials_path
+        project_root = bpy.path.abspath(scene.godot_project_root)
+        if not textures_folder or not os.path.isdir(textures_folder):
+            self.report({'ERROR'}, "Textures folder not set or invalid. Please set asset folder path first.")
+            return {'CANCELLED'}
+        stages = []
+        if self.export_textures:
+            stages.append(texture_export_stage(scene, textures_folder))
+        if self.export_materials:
+            if not (materials_folder and os.path.isdir(materials_folder)):
+                self.report({'ERROR'}, "Materials folder not set or invalid.")
+                return {'CANCELLED'}
+            if not (project_root and os.path.isdir(project_root)):
+                self.report({'ERROR'}, "Godot project root not set or invalid.")
+                return {'CANCELLED'}
+            materials = {slot.material for obj in context.selected_objects
+                         if obj.type == 'MESH' for slot in obj.material_slots if slot.material}
+            stages.append(material_export_stage(scene, materials, materials_folder, textures_folder, project_root))
+        _export_job = ExportJob(stages)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        job = _export_job
+        if event.type == 'ESC':
+            job.cancelled = True
+        elif event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        if job.cancelled:
+            job.cancel()
+            self.finish(context)
+            self.report({'WARNING'}, "Export cancelled; partial files removed.")
+            return {'CANCELLED'}
+        finished = job.tick()
+        self.redraw(context)
+        if not finished:
+            return {'RUNNING_MODAL'}
+        job.close()
+        self.finish(context)
+        for error in job.errors:
+            self.report({'WARNING'}, error)
+        counts = ", ".join(f"{stage.done} {stage.name.lower()}" for stage in job.stages)
+        self.report({'INFO'}, f"Exported {counts}.")
+        return {'FINISHED'}
+
+    def finish(self, context):
+        global _export_job
+        context.window_manager.event_timer_remove(self._timer)
+        _export_job = None
+        self.redraw(context)
+
+    def redraw(self, context):
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+class OBJECT_OT_cancel_export_job(bpy.types.Operator):
+    """Cancel the running BlenGo export and remove its partial output"""
+    bl_idname = "object.cancel_export_job"
+    bl_label = "Cancel Export"
+
+    def execute(self, context):
+        if _export_job is not None:
+            _export_job.cancelled = True
+        return {'FINISHED'}
+
+###############################
+# glTF Export Hooks
+###############################
+
+SIDECAR_VERSION = 1
+
+def sidecar_path_for(scene_path):
+    """Path of the BlenGo property index written next to an exported scene."""
+    return os.path.splitext(scene_path)[0] + ".blengo.json"
+
+def _plain_value(value):
+    """Convert ID property values to plain JSON types."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    return value
+
+def gather_blengo_props(id_data):
+    """Return the blengo_* custom properties of an ID as a plain dictionary."""
+    return {key: _plain_value(id_data[key]) for key in id_data.keys() if key.startswith("blengo_")}
+
+def write_sidecar_index(scene_path, index):
+    """Write the sidecar index for scene_path, stamping it with a hash of its contents."""
+    content = {section: index[section] for section in ("materials", "nodes", "meshes", "lightmap_uv2", "prebuilt_lods")}
+    digest = hashlib.sha1(json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+    sidecar = {"version": SIDECAR_VERSION, "scene": os.path.basename(scene_path), "hash": digest}
+    sidecar.update(content)
+    with open(sidecar_path_for(scene_path), "w", encoding="utf-8") as f:
+        json.dump(sidecar, f, sort_keys=True, separators=(",", ":"))
+    return digest
+
+class glTF2ExportUserExtension:
+    """Picked up by Blender's glTF exporter; adjusts the exported data without touching source objects."""
+
+    def __init__(self):
+        scene = bpy.context.scene
+        self.suffix_rules = []
+        if scene and getattr(scene, "godot_suffix_rules_enabled", False):
+            self.suffix_rules = compile_suffix_rules(scene)
+
+    def gather_node_hook(self, gltf2_object, blender_object, export_settings):
+        if blender_object is None:
+            return
+        if self.suffix_rules:
+            suffix = resolve_godot_suffix(blender_object, self.suffix_rules)
+            gltf2_object.name = apply_godot_suffix(gltf2_object.name or blender_object.name, suffix)
+        index = export_settings.get("blengo_index")
+        if index is not None:
+            record_sidecar_entries(index, gltf2_object.name or blender_object.name, blender_object)
+
+def record_sidecar_entries(index, node_name, blender_object):
+    """Add the blengo_* properties of an exported object, its mesh and its materials to the index."""
+    props = gather_blengo_props(blender_object)
+    if props:
+        index["nodes"][node_name] = props
+    if blender_object.type == 'MESH' and blender_object.data:
+        mesh = blender_object.data
+        if mesh.name not in index["meshes"]:
+            props = gather_blengo_props(mesh)
+            if props:
+                index["meshes"][mesh.name] = props
+            if has_baked_lightmap_uv(mesh) and mesh.name not in index["lightmap_uv2"]:
+                index["lightmap_uv2"].append(mesh.name)
+        # Sources and levels of a BlenGo LOD chain must not get Godot's import-time LODs on top.
+        if "blengo_lod" in blender_object and mesh.name not in index["prebuilt_lods"]:
+            index["prebuilt_lods"].append(mesh.name)
+    for slot in blender_object.material_slots:
+        mat = slot.material
+        if mat and mat.name not in index["materials"]:
+            props = gather_blengo_props(mat)
+            if props:
+                index["materials"][mat.name] = props
+
+def glTF2_pre_export_callback(export_settings):
+    scene = bpy.context.scene
+    if scene and getattr(scene, "godot_write_sidecar", False):
+        export_settings["blengo_index"] = {"materials": {}, "nodes": {}, "meshes": {}, "lightmap_uv2": [], "prebuilt_lods": []}
+
+def glTF2_post_export_callback(export_settings):
+    index = export_settings.get("blengo_index")
+    scene_path = export_settings.get("gltf_filepath")
+    if index is None or not scene_path:
+        return
+    try:
+        write_sidecar_index(scene_path, index)
+    except OSError as e:
+        print(f"BlenGo: could not write sidecar for {scene_path}: {e}")
+
 ###############################
 # Initialization Functions
 ###############################
@@ -744,20 +2665,13 @@ def init_properties():
     bpy.types.Scene.godot_suffix = EnumProperty(
         name="Suffix",
         description="Select the suffix to work with",
-        items=[
-            ("-navmesh", "-navmesh", "Suffix for navigation meshes"),
-            ("-occ", "-occ", "Suffix for occlusion objects"),
-            ("-rigid", "-rigid", "Suffix for rigid bodies"),
-            ("-cycle", "-cycle", "Suffix for cyclic animations or cycles"),
-            ("-vehicle", "-vehicle", "Suffix for vehicles"),
-            ("-wheel", "-wheel", "Suffix for wheels"),
-            ("-col", "-col", "Suffix for collision objects"),
-            ("-convcol", "-convcol", "Suffix for convex collisions"),
-            ("-colonly", "-colonly", "Suffix for collision-only objects"),
-            ("-convcolonly", "-convcolonly", "Suffix for convex collision-only objects")
-        ],
+        items=GODOT_SUFFIX_ITEMS,
         default="-rigid"
     )
+    bpy.types.Scene.godot_suffix_rules = CollectionProperty(type=GodotSuffixRule)
+    bpy.types.Scene.godot_suffix_rules_enabled = BoolProperty(
+        name="Apply Suffix Rules on Export", default=True,
+        description="Add rule-based suffixes to node names in the exported glTF; source objects keep their names")
     bpy.types.Scene.godot_collision_tools_collapsible = BoolProperty(
         name="Add Collision for Selected Objects", default=True,
         description="Show collision tools for adding a collision object to selected objects")
@@ -767,6 +2681,15 @@ def init_properties():
         items=[("CUBE", "Cube", "Cube"), ("CYLINDER", "Cylinder", "Cylinder (5 vertices)")],
         default="CUBE"
     )
+    bpy.types.Scene.godot_lod_tools_collapsible = BoolProperty(
+        name="LOD Tools", default=False,
+        description="Show tools for generating LOD chains for selected meshes")
+    bpy.types.Scene.godot_lod_ratios = StringProperty(
+        name="LOD Ratios", default="0.5, 0.25, 0.1",
+        description="Comma separated face ratio for each LOD level")
+    bpy.types.Scene.godot_lod_distance = FloatProperty(
+        name="LOD Distance", default=20.0, min=0.1, unit='LENGTH',
+        description="Distance at which LOD1 takes over; each further level starts at twice the previous distance")
     bpy.types.Scene.godot_asset_data_collapsible = BoolProperty(
         name="Asset Folder Path", default=True,
         description="Set asset folder path and create asset subfolders for the blend file")
@@ -780,6 +2703,9 @@ def init_properties():
                ("4096", "4K", "Export textures at 4K resolution")],
         default="1024"
     )
+    bpy.types.Scene.godot_texture_hardlink = BoolProperty(
+        name="Hardlink Textures", default=True,
+        description="Hardlink unchanged texture files into the textures folder when it is on the same drive, instead of copying them")
     bpy.types.Scene.godot_asset_asset_path = StringProperty(
         name="Asset Folder", description="Asset folder for this blend file", default=""
     )
@@ -792,6 +2718,37 @@ def init_properties():
     bpy.types.Scene.godot_asset_materials_path = StringProperty(
         name="Materials Folder", description="Materials subfolder path", default=""
     )
+    bpy.types.Scene.godot_material_export_mode = EnumProperty(
+        name="Material Type",
+        description="Kind of Godot material written by Export Materials",
+        items=[
+            ("STANDARD", "StandardMaterial3D", "Map base color, metallic, roughness and normal textures"),
+            ("SHADER", "ShaderMaterial", "Translate the node graph into shared shaders; unsupported graphs fall back to StandardMaterial3D")
+        ],
+        default="STANDARD"
+    )
+    bpy.types.Scene.godot_chunk_mode = EnumProperty(
+        name="Chunk By",
+        description="How Export Chunks partitions the level",
+        items=[
+            ("GRID", "Grid", "One chunk per grid cell, by the center of each top-level object"),
+            ("COLLECTION", "Collection", "One chunk per top-level collection")
+        ],
+        default="GRID"
+    )
+    bpy.types.Scene.godot_chunk_size = FloatProperty(
+        name="Cell Size", default=64.0, min=1.0, unit='LENGTH',
+        description="Grid cell size used by Export Chunks")
+    bpy.types.Scene.godot_export_profiles = CollectionProperty(type=GodotExportProfile)
+    bpy.types.Scene.godot_export_profile = StringProperty(
+        name="Export Profile", default="",
+        description="Profile used by Export Scene and Export Chunks; leave empty to use the exporter dialog")
+    bpy.types.Collection.godot_export_profile = StringProperty(
+        name="Export Profile", default="",
+        description="Profile used when this collection is exported as its own chunk; empty uses the scene profile")
+    bpy.types.Scene.godot_write_sidecar = BoolProperty(
+        name="Write Property Index", default=True,
+        description="Write a <scene>.blengo.json index of BlenGo properties next to every exported glTF")
     bpy.types.Scene.godot_project_root = StringProperty(
         name="Godot Project Root",
         description="The root folder of your Godot project (corresponds to res://)",
@@ -816,6 +2773,18 @@ def init_properties():
     bpy.types.Scene.godot_custom_asset_data_collapsible = BoolProperty(
         name="Custom Asset Data", default=True,
         description="Show custom asset data (material, object, and mesh properties)")
+    bpy.types.Scene.godot_anim_tolerance_location = FloatProperty(
+        name="Location Tolerance", default=0.001, min=0.0, precision=4,
+        description="Maximum location error (in units) allowed when removing keys")
+    bpy.types.Scene.godot_anim_tolerance_rotation = FloatProperty(
+        name="Rotation Tolerance", default=0.0005, min=0.0, precision=4,
+        description="Maximum rotation channel error (radians or quaternion components) allowed when removing keys")
+    bpy.types.Scene.godot_anim_tolerance_scale = FloatProperty(
+        name="Scale Tolerance", default=0.001, min=0.0, precision=4,
+        description="Maximum scale error allowed when removing keys")
+    bpy.types.Scene.godot_anim_tolerance_default = FloatProperty(
+        name="Other Tolerance", default=0.001, min=0.0, precision=4,
+        description="Maximum error allowed when removing keys from any other channel")
     bpy.types.Scene.godot_fix_root_bone_collapsible = BoolProperty(
         name="Fix Root Bone Rotations", default=True,
         description="Show fix root bone rotations options")
@@ -842,6 +2811,15 @@ class VIEW3D_PT_godot_tools_panel(bpy.types.Panel):
         row_anim.prop(scene, "godot_fix_root_bone_collapsible", text="Animation tools", icon=anim_icon)
         if scene.godot_fix_root_bone_collapsible:
             anim_box.operator("object.godot_tools", text="Run Root Fix")
+            row_root_motion = anim_box.row(align=True)
+            row_root_motion.operator("object.extract_root_motion", text="Extract Root Motion")
+            row_root_motion.operator("object.batch_root_motion_files", text="Batch Files")
+            reduce_col = anim_box.column(align=True)
+            reduce_col.prop(scene, "godot_anim_tolerance_location", text="Location Tolerance")
+            reduce_col.prop(scene, "godot_anim_tolerance_rotation", text="Rotation Tolerance")
+            reduce_col.prop(scene, "godot_anim_tolerance_scale", text="Scale Tolerance")
+            reduce_col.prop(scene, "godot_anim_tolerance_default", text="Other Tolerance")
+            anim_box.operator("object.reduce_keyframes", text="Reduce Keyframes")
         
         suffix_box = layout.box()
         row_suffix = suffix_box.row(align=True)
@@ -853,6 +2831,26 @@ class VIEW3D_PT_godot_tools_panel(bpy.types.Panel):
             row_suffix_buttons = suffix_box.row(align=True)
             row_suffix_buttons.operator("object.suffix_tools_add", text="Add Suffix")
             row_suffix_buttons.operator("object.suffix_tools_remove", text="Remove Suffix")
+            rules_box = suffix_box.box()
+            rules_box.prop(scene, "godot_suffix_rules_enabled", text="Apply Suffix Rules on Export")
+            for i, rule in enumerate(scene.godot_suffix_rules):
+                row = rules_box.row(align=True)
+                row.prop(rule, "match_type", text="")
+                row.prop(rule, "pattern", text="")
+                row.prop(rule, "suffix", text="")
+                row.operator("object.delete_suffix_rule", text="", icon="PANEL_CLOSE").index = i
+            rules_box.operator("object.add_suffix_rule", text="Add Suffix Rule")
+        
+        lod_box = layout.box()
+        row_lod = lod_box.row(align=True)
+        lod_icon = "TRIA_DOWN" if scene.godot_lod_tools_collapsible else "TRIA_RIGHT"
+        row_lod.prop(scene, "godot_lod_tools_collapsible", text="LOD Tools", icon=lod_icon)
+        if scene.godot_lod_tools_collapsible:
+            lod_box.prop(scene, "godot_lod_ratios", text="Ratios")
+            lod_box.prop(scene, "godot_lod_distance", text="LOD1 Distance")
+            row_lod_buttons = lod_box.row(align=True)
+            row_lod_buttons.operator("object.generate_lods", text="Generate LODs")
+            row_lod_buttons.operator("object.clear_lods", text="Clear LODs")
         
         asset_box = layout.box()
         row_asset = asset_box.row(align=True)
@@ -866,10 +2864,48 @@ class VIEW3D_PT_godot_tools_panel(bpy.types.Panel):
                 asset_box.prop(scene, "godot_texture_rescale", text="Rescale Textures")
                 if scene.godot_texture_rescale:
                     asset_box.prop(scene, "godot_texture_resolution", text="Texture Resolution")
+                else:
+                    asset_box.prop(scene, "godot_texture_hardlink", text="Hardlink Textures")
+                asset_box.prop(scene, "godot_material_export_mode", text="Material Type")
+                profile_box = asset_box.box()
+                profile_row = profile_box.row(align=True)
+                profile_row.prop_search(scene, "godot_export_profile", scene, "godot_export_profiles", text="Profile")
+                profile_row.operator("object.add_export_profile", text="", icon="ADD")
+                profile = scene.godot_export_profiles.get(scene.godot_export_profile)
+                if profile:
+                    profile_row.operator("object.delete_export_profile", text="", icon="PANEL_CLOSE")
+                    profile_box.prop(profile, "name")
+                    profile_box.prop(profile, "export_format")
+                    keep_row = profile_box.row(align=True)
+                    keep_row.prop(profile, "keep_normals", toggle=True)
+                    keep_row.prop(profile, "keep_tangents", toggle=True)
+                    keep_row.prop(profile, "keep_uvs", toggle=True)
+                    keep_row.prop(profile, "keep_vertex_colors", toggle=True)
+                    keep_row.prop(profile, "keep_attributes", toggle=True)
+                    keep_row.prop(profile, "keep_images", toggle=True)
+                    profile_box.prop(profile, "sample_animations")
+                if context.collection and context.collection != scene.collection:
+                    profile_box.prop_search(context.collection, "godot_export_profile", scene, "godot_export_profiles",
+                                            text=f"{context.collection.name} Profile")
+                chunk_row = asset_box.row(align=True)
+                chunk_row.prop(scene, "godot_chunk_mode", text="")
+                if scene.godot_chunk_mode == 'GRID':
+                    chunk_row.prop(scene, "godot_chunk_size", text="Cell")
+                chunk_row.operator("object.export_chunks", text="Export Chunks")
                 export_row = asset_box.row(align=True)
                 export_row.operator("object.export_gltf_fixed", text="Export Scene")
                 export_row.operator("object.export_textures", text="Export Textures")
                 export_row.operator("object.export_materials", text="Export Materials")
+                if _export_job is None:
+                    asset_box.operator("object.export_job", text="Background Export")
+                else:
+                    job_box = asset_box.box()
+                    for stage in _export_job.stages:
+                        job_box.label(text=f"{stage.name}: {stage.done}/{stage.total}")
+                    job_box.progress(factor=_export_job.progress, type='BAR',
+                                     text=f"{int(_export_job.progress * 100)}%")
+                    job_box.operator("object.cancel_export_job", text="Cancel Export", icon="CANCEL")
+                asset_box.prop(scene, "godot_write_sidecar", text="Write Property Index")
                 asset_box.label(text="Scene Folder: " + scene.godot_asset_scene_path)
         
         if context.active_object:
@@ -925,6 +2961,7 @@ class VIEW3D_PT_godot_tools_panel(bpy.types.Panel):
                                     row.prop(item, "prop_description", text="tag:")
                                 row.operator("object.delete_godot_mesh_property", text="", icon="PANEL_CLOSE").index = i
                             sub_mesh_box.operator("object.add_godot_mesh_property", text="Add Godot Mesh Property")
+                            sub_mesh_box.operator("object.generate_lightmap_uvs", text="Generate Lightmap UVs")
 
 ###############################
 # Registration
@@ -933,13 +2970,26 @@ class VIEW3D_PT_godot_tools_panel(bpy.types.Panel):
 classes = [
     VIEW3D_PT_godot_tools_panel,
     OBJECT_OT_godot_tools,
+    OBJECT_OT_reduce_keyframes,
+    OBJECT_OT_extract_root_motion,
+    OBJECT_OT_batch_root_motion_files,
     OBJECT_OT_suffix_tools_add,
     OBJECT_OT_suffix_tools_remove,
+    OBJECT_OT_add_suffix_rule,
+    OBJECT_OT_delete_suffix_rule,
     OBJECT_OT_add_collision,
+    OBJECT_OT_generate_lods,
+    OBJECT_OT_clear_lods,
+    OBJECT_OT_generate_lightmap_uvs,
     OBJECT_OT_set_asset_folder_path,
     OBJECT_OT_export_textures,
+    OBJECT_OT_add_export_profile,
+    OBJECT_OT_delete_export_profile,
     OBJECT_OT_export_gltf_fixed,
+    OBJECT_OT_export_chunks,
     OBJECT_OT_export_materials,
+    OBJECT_OT_export_job,
+    OBJECT_OT_cancel_export_job,
     OBJECT_OT_add_material_property,
     OBJECT_OT_delete_material_property,
     OBJECT_OT_add_object_property,
@@ -949,6 +2999,8 @@ classes = [
     GodotMaterialProperty,
     GodotObjectProperty,
     GodotMeshProperty,
+    GodotSuffixRule,
+    GodotExportProfile,
 ]
 
 def register():
@@ -960,17 +3012,22 @@ def unregister():
     for cls in classes:
         bpy.utils.unregister_class(cls)
     props = [
-        "godot_suffix_tools_collapsible", "godot_suffix", "godot_collision_tools_collapsible",
+        "godot_suffix_tools_collapsible", "godot_suffix", "godot_suffix_rules", "godot_suffix_rules_enabled",
+        "godot_collision_tools_collapsible", "godot_lod_tools_collapsible", "godot_lod_ratios", "godot_lod_distance",
         "godot_collision_shape", "godot_asset_data_collapsible", "godot_texture_rescale",
-        "godot_texture_resolution", "godot_asset_asset_path", "godot_asset_scene_path",
-        "godot_asset_textures_path", "godot_asset_materials_path", "godot_project_root",
+        "godot_texture_resolution", "godot_texture_hardlink", "godot_asset_asset_path", "godot_asset_scene_path",
+        "godot_asset_textures_path", "godot_asset_materials_path", "godot_project_root", "godot_write_sidecar",
+        "godot_material_export_mode", "godot_chunk_mode", "godot_chunk_size", "godot_export_profiles", "godot_export_profile",
         "godot_custom_material_properties_collapsible", "godot_custom_object_properties_collapsible",
         "godot_custom_mesh_properties_collapsible", "godot_custom_asset_data_collapsible",
-        "godot_fix_root_bone_collapsible"
+        "godot_fix_root_bone_collapsible", "godot_anim_tolerance_location", "godot_anim_tolerance_rotation",
+        "godot_anim_tolerance_scale", "godot_anim_tolerance_default"
     ]
     for prop in props:
         if hasattr(bpy.types.Scene, prop):
             delattr(bpy.types.Scene, prop)
+    if hasattr(bpy.types.Collection, "godot_export_profile"):
+        del bpy.types.Collection.godot_export_profile
     for typ in [bpy.types.Material, bpy.types.Object, bpy.types.Mesh]:
         for attr in ["godot_material_properties", "godot_material_properties_index", 
                      "godot_object_properties", "godot_object_properties_index",
@@ -979,4 +3036,7 @@ def unregister():
                 delattr(typ, attr)
 
 if __name__ == "__main__":
-    register()
+    if "--blengo-root-motion" in sys.argv:
+        run_root_motion_worker(sys.argv)
+    else:
+        register()
@@ -0,0 +1,122 @@
+@tool
+extends EditorScenePostImport
+
+# Assigned to BlenGo scenes by ReImporter. Applies the selected object and mesh properties from the
+# scene's sidecar index in a single traversal of the imported scene.
+
+const Sidecar = preload("res://addons/blengo/scripts/Sidecar.gd")
+# Godot strips these import hints from node names, so sidecar names are matched without them.
+const GODOT_SUFFIXES = ["-navmesh", "-occ", "-rigid", "-cycle", "-vehicle", "-wheel",
+	"-col", "-convcol", "-colonly", "-convcolonly"]
+
+# Scripts shared by many nodes are loaded once per editor session.
+static var _script_cache := {}
+
+func _post_import(scene: Node) -> Object:
+	var nodes_by_name = {}
+	var mesh_instances = []
+	_collect_nodes(scene, nodes_by_name, mesh_instances)
+
+	var index = Sidecar.load_index(get_source_file())
+	var node_props = index.get("nodes", {})
+	var mesh_props = index.get("meshes", {})
+	if index.is_empty():
+		# Scenes exported without a sidecar still carry their properties as glTF extras.
+		for node_name in nodes_by_name.keys():
+			var props = _blengo_extras(nodes_by_name[node_name])
+			if not props.is_empty():
+				node_props[node_name] = props
+		for mesh_instance in mesh_instances:
+			if mesh_instance.mesh:
+				var props = _blengo_extras(mesh_instance.mesh)
+				if not props.is_empty():
+					mesh_props[mesh_instance.mesh.resource_name] = props
+
+	# Only the entries ticked in the Set Properties dialog are applied.
+	var selection = Sidecar.load_selection(get_source_file())
+	if not selection.is_empty():
+		node_props = _selected(node_props, selection.get("nodes", []))
+		mesh_props = _selected(mesh_props, selection.get("meshes", []))
+
+	for node_name in node_props.keys():
+		var node = nodes_by_name.get(_godot_node_name(node_name))
+		if node == null:
+			print("BlenGo: node not found in imported scene: ", node_name)
+			continue
+		for value in node_props[node_name].values():
+			_apply_object_property(node, str(value))
+
+	if not mesh_props.is_empty():
+		for mesh_instance in mesh_instances:
+			var mesh = mesh_instance.mesh
+			if mesh and mesh_props.has(mesh.resource_name):
+				for value in mesh_props[mesh.resource_name].values():
+					_apply_mesh_property(mesh_instance, str(value))
+	return scene
+
+func _selected(props: Dictionary, names: Array) -> Dictionary:
+	var selected = {}
+	for item_name in props.keys():
+		if names.has(item_name):
+			selected[item_name] = props[item_name]
+	return selected
+
+# Walks the scene once, indexing nodes by name and remembering every mesh instance.
+func _collect_nodes(root: Node, nodes_by_name: Dictionary, mesh_instances: Array) -> void:
+	var stack = [root]
+	while not stack.is_empty():
+		var node = stack.pop_back()
+		nodes_by_name[String(node.name)] = node
+		if node is MeshInstance3D:
+			mesh_instances.append(node)
+		stack.append_array(node.get_children())
+
+func _blengo_extras(object: Object) -> Dictionary:
+	var props = {}
+	if object.has_meta("extras"):
+		var extras = object.get_meta("extras")
+		if typeof(extras) == TYPE_DICTIONARY:
+			for key in extras.keys():
+				if str(key).begins_with("blengo_"):
+					props[key] = extras[key]
+	return props
+
+func _godot_node_name(node_name: String) -> String:
+	for suffix in GODOT_SUFFIXES:
+		if node_name.ends_with(suffix):
+			node_name = node_name.left(node_name.length() - suffix.length())
+			break
+	return node_name.validate_node_name()
+
+func _apply_object_property(node: Node, value: String) -> void:
+	if value == "CastShadowOn" or value == "CastShadowOff":
+		if node is GeometryInstance3D:
+			node.cast_shadow = GeometryInstance3D.SHADOW_CASTING_SETTING_ON if value == "CastShadowOn" else GeometryInstance3D.SHADOW_CASTING_SETTING_OFF
+	elif value.begins_with("visibility_range:"):
+		# Written by BlenGo's LOD generator as visibility_range:<begin>:<end>; an end of 0 never hides.
+		var parts = value.split(":")
+		if node is GeometryInstance3D and parts.size() == 3:
+			node.visibility_range_begin = parts[1].to_float()
+			node.visibility_range_end = parts[2].to_float()
+	elif value.begins_with("scriptpath:"):
+		var script = _load_script(value.substr("scriptpath:".length()))
+		if script:
+			node.set_script(script)
+
+func _apply_mesh_property(mesh_instance: MeshInstance3D, value: String) -> void:
+	match value:
+		"LightMapOn":
+			mesh_instance.gi_mode = GeometryInstance3D.GI_MODE_STATIC
+		"LightMapOff":
+			mesh_instance.gi_mode = GeometryInstance3D.GI_MODE_DISABLED
+		"ShadowMeshesOff":
+			if mesh_instance.mesh is ArrayMesh:
+				mesh_instance.mesh.shadow_mesh = null
+
+func _load_script(path: String) -> Script:
+	if not _script_cache.has(path):
+		var script = load(path) as Script if ResourceLoader.exists(path) else null
+		if script == null:
+			print("BlenGo: could not load script: ", path)
+		_script_cache[path] = script
+	return _script_cache[path]
@@ -0,0 +1,115 @@
+extends Node3D
+class_name BlenGoChunkStreamer
+
+# Streams the chunks written by BlenGo's Export Chunks around a target node.
+# Chunks closer than load_distance are requested on a background thread; loaded chunks are only
+# freed once they are farther than unload_distance, so a target on a cell border doesn't thrash.
+
+@export_file("*.json") var manifest_path: String = ""
+@export var target: Node3D
+@export var load_distance: float = 96.0
+@export var unload_distance: float = 128.0
+@export var memory_budget_mb: float = 256.0
+@export var update_interval: float = 0.25
+
+var _chunks: Array = []
+var _pending: Dictionary = {}
+var _loaded: Dictionary = {}
+var _elapsed: float = 0.0
+
+func _ready() -> void:
+	_load_manifest()
+
+func _load_manifest() -> void:
+	_chunks.clear()
+	if manifest_path.is_empty() or not FileAccess.file_exists(manifest_path):
+		push_warning("BlenGo chunk manifest not found: " + manifest_path)
+		return
+	var data = JSON.parse_string(FileAccess.get_file_as_string(manifest_path))
+	if typeof(data) != TYPE_DICTIONARY:
+		push_warning("Invalid BlenGo chunk manifest: " + manifest_path)
+		return
+	var base_dir = manifest_path.get_base_dir()
+	for entry in data.get("chunks", []):
+		var aabb_min = _vector(entry["aabb_min"])
+		_chunks.append({
+			"name": entry["name"],
+			"path": base_dir.path_join(entry["file"]),
+			"aabb": AABB(aabb_min, _vector(entry["aabb_max"]) - aabb_min),
+			"bytes": int(entry.get("bytes", 0)),
+		})
+
+func _vector(values: Array) -> Vector3:
+	return Vector3(values[0], values[1], values[2])
+
+func _process(delta: float) -> void:
+	_poll_pending()
+	_elapsed += delta
+	if _elapsed < update_interval or target == null:
+		return
+	_elapsed = 0.0
+	_update_streaming(target.global_position)
+
+func _distance(chunk: Dictionary, position: Vector3) -> float:
+	var aabb: AABB = chunk["aabb"]
+	var local = global_transform.affine_inverse() * position
+	return local.distance_to(local.clamp(aabb.position, aabb.end))
+
+func _used_bytes() -> int:
+	var used = 0
+	for chunk in _chunks:
+		if _loaded.has(chunk["path"]) or _pending.has(chunk["path"]):
+			used += chunk["bytes"]
+	return used
+
+func _update_streaming(position: Vector3) -> void:
+	var budget = int(memory_budget_mb * 1024.0 * 1024.0)
+	var by_distance = _chunks.duplicate()
+	by_distance.sort_custom(func(a, b): return _distance(a, position) < _distance(b, position))
+
+	for chunk in by_distance:
+		if _loaded.has(chunk["path"]) and _distance(chunk, position) > unload_distance:
+			_unload(chunk)
+
+	var used = _used_bytes()
+	for chunk in by_distance:
+		var path = chunk["path"]
+		if _loaded.has(path) or _pending.has(path) or _distance(chunk, position) > load_distance:
+			continue
+		# Make room by dropping the farthest loaded chunks that are still inside the hysteresis band.
+		var index = by_distance.size() - 1
+		while used + chunk["bytes"] > budget and index >= 0:
+			var far = by_distance[index]
+			index -= 1
+			if far == chunk or _distance(far, position) <= _distance(chunk, position):
+				break
+			if _loaded.has(far["path"]):
+				_unload(far)
+				used -= far["bytes"]
+		if used + chunk["bytes"] > budget:
+			break
+		if ResourceLoader.load_threaded_request(path, "PackedScene") == OK:
+			_pending[path] = chunk
+			used += chunk["bytes"]
+
+func _poll_pending() -> void:
+	for path in _pending.keys():
+		var status = ResourceLoader.load_threaded_get_status(path)
+		if status == ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+			continue
+		var chunk = _pending[path]
+		_pending.erase(path)
+		if status != ResourceLoader.THREAD_LOAD_LOADED:
+			push_warning("Failed to stream BlenGo chunk: " + path)
+			continue
+		var scene: PackedScene = ResourceLoader.load_threaded_get(path)
+		var instance = scene.instantiate()
+		instance.name = chunk["name"]
+		add_child(instance)
+		_loaded[path] = instance
+
+func _unload(chunk: Dictionary) -> void:
+	var instance = _loaded.get(chunk["path"])
+	_loaded.erase(chunk["path"])
+	if is_instance_valid(instance):
+		instance.queue_free()
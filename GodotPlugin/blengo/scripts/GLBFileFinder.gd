@@ -1,6 +1,8 @@
 @tool
 extends Node
 
+const Sidecar = preload("res://addons/blengo/scripts/Sidecar.gd")
+
 var file_dialog: FileDialog
 var editor_interface: EditorInterface
 signal glb_selected(path)
@@ -21,11 +23,32 @@ func execute(editor_interface: EditorInterface) -> void:
 # Triggered after the user selects a file
 func _on_file_selected(selected_file: String) -> void:
 	print("Selected GLB file: ", selected_file)
-	var entries = _process_glb_file(selected_file)
 	file_dialog.queue_free()
+	var entries = []
+	# Prefer the sidecar index written by BlenGo; fall back to parsing the GLB for older exports.
+	var index = Sidecar.load_index(selected_file)
+	if index.is_empty():
+		entries = _process_glb_file(selected_file)
+	elif Sidecar.is_processed(selected_file, index):
+		_confirm_reprocess(selected_file, Sidecar.entries_from_index(index))
+		return
+	else:
+		entries = Sidecar.entries_from_index(index)
 	# Pass the selected file path along with the data
 	_display_data_in_menu(entries, selected_file)
 
+# The scene's properties haven't changed since they were last applied; let the user reopen it anyway,
+# e.g. after deleting the .import file.
+func _confirm_reprocess(file_path: String, entries: Array) -> void:
+	var dialog = ConfirmationDialog.new()
+	dialog.title = "BlenGo"
+	dialog.dialog_text = "No BlenGo property changes since this scene was last processed.\nOpen its properties anyway?"
+	dialog.ok_button_text = "Open"
+	dialog.confirmed.connect(func(): _display_data_in_menu(entries, file_path))
+	dialog.visibility_changed.connect(func(): if not dialog.visible: dialog.queue_free())
+	editor_interface.get_base_control().add_child(dialog)
+	dialog.popup_centered()
+
 # Process the GLB file and extract JSON data
 func _process_glb_file(file_path: String) -> Array:
 	var entries = []
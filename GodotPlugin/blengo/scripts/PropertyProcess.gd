@@ -1,6 +1,8 @@
 @tool
 extends Window
 
+const Sidecar = preload("res://addons/blengo/scripts/Sidecar.gd")
+
 # UI Containers
 @onready var data_container = $MarginContainer/VBoxContainer/HBoxContainer/VBoxContainer/itemboxcontainer/ItemScrollContainer/VBoxContainer
 @onready var cancel_button = $MarginContainer/VBoxContainer/bottombar/cancel_button
@@ -86,9 +88,12 @@ func set_data(data: String, path: String) -> void:
 # Called when the user presses the Apply button
 func _on_apply_button_pressed() -> void:
 	print("\n=== Processing Items ===")
+	var all_applied = true
 	for item in item_containers:
 		var cb = item.get_meta("check_button")
-		if cb and cb.is_pressed():
+		if not (cb and cb.is_pressed()):
+			all_applied = false
+		else:
 			var full_text = item.get_meta("full_text")
 			var type_value = item.get_meta("type")
 			# Delegate processing to ReImporter.
@@ -100,6 +105,11 @@ func _on_apply_button_pressed() -> void:
 				reimporter.process_object_item(full_text)
 			else:
 				print("Unknown type: ", type_value)
+	# Write all collected changes to the .import file in one go.
+	reimporter.rewrite_import_file()
+	# Skipped items keep the scene listed, so they can still be applied later.
+	if all_applied:
+		Sidecar.mark_processed(file_path)
 	# After processing, close the window
 	queue_free()
 
@@ -1,8 +1,13 @@
 @tool
 extends Node
 
+const POST_IMPORT_SCRIPT = "res://addons/blengo/scripts/BlenGoPostImport.gd"
+const Sidecar = preload("res://addons/blengo/scripts/Sidecar.gd")
+
 var file_path: String
 var material_changes := {}
+var object_changes := {}
+var mesh_changes := {}
 
 func set_file_path(path: String) -> void:
 	file_path = path
@@ -36,99 +41,118 @@ func process_material_item(data: String) -> void:
 		material_settings = {"raw": property_str}
 	
 	material_changes[material_name] = material_settings
-	rewrite_import_file()
 
+# Mesh and object properties are applied by BlenGoPostImport, which reads them from the sidecar;
+# here we record which ones were selected so only those are applied.
 func process_mesh_item(data: String) -> void:
 	print("Processing Mesh item: ", data)
 	print("From file: ", file_path)
-	# Your mesh processing code here.
+	var parts = data.split(",", false)
+	if parts.size() < 3:
+		print("Invalid data format for mesh: ", data)
+		return
+	var mesh_name = parts[1].replace("Name:", "").strip_edges()
+	mesh_changes[mesh_name] = parts[2].replace("Property:", "").strip_edges()
 
 func process_object_item(data: String) -> void:
 	print("Processing Object item: ", data)
 	print("From file: ", file_path)
-	# Your object processing code here.
+	var parts = data.split(",", false)
+	if parts.size() < 3:
+		print("Invalid data format for object: ", data)
+		return
+	var object_name = parts[1].replace("Name:", "").strip_edges()
+	object_changes[object_name] = parts[2].replace("Property:", "").strip_edges()
 
-# This function reads, updates (or appends), and rewrites the .import file
+# Merges the collected changes into the scene's .import file. The file is edited through ConfigFile so
+# Godot's own formatting and any settings made in the Advanced Import dialog are preserved.
 func rewrite_import_file() -> void:
 	if file_path == "":
 		print("File path not set.")
 		return
 	# Determine the import file path (e.g., "asset.glb.import")
+	# Saved even when nothing is ticked, so items unchecked since the last Apply stop being applied.
+	Sidecar.save_selection(file_path, object_changes.keys(), mesh_changes.keys())
 	var import_file_path = file_path + ".import"
-	var file = FileAccess.open(import_file_path, FileAccess.READ)
-	if file == null:
+	var config = ConfigFile.new()
+	var err = config.load(import_file_path)
+	if err != OK:
 		print("Failed to open import file: ", import_file_path)
 		return
-	var content = file.get_as_text()
-	file.close()
-	
-	# Generate the new _subresources block text from the material_changes dictionary
-	var new_subresources = _generate_materials_block()
-	if new_subresources == "":
-		print("No material changes to apply.")
-		return
 
-	# Use a regex to see if an _subresources block already exists
-	var regex = RegEx.new()
-	var pattern = r"(?s)_subresources\s*=\s*\{.*?\}"
-	var err = regex.compile(pattern)
-	if err != OK:
-		print("Regex compilation error.")
+	var needs_post_import = object_changes.size() > 0 or mesh_changes.size() > 0
+	# Meshes that already have a BlenGo LOD chain skip Godot's own LOD generation.
+	var prebuilt_lods = Sidecar.load_index(file_path).get("prebuilt_lods", [])
+	if material_changes.size() == 0 and not _has_mesh_settings() and not needs_post_import and prebuilt_lods.is_empty():
+		print("No changes to apply.")
 		return
-	if regex.search(content):
-		# Replace the existing _subresources block with the new one
-		content = regex.sub(content, new_subresources)
-	else:
-		# Append the new _subresources block at the end.
-		content += "\n" + new_subresources + "\n"
-	# Write the modified content back to the .import file
-	file = FileAccess.open(import_file_path, FileAccess.WRITE)
-	if file:
-		file.store_string(content)
-		file.close()
+
+	var subresources = config.get_value("params", "_subresources", {})
+	if typeof(subresources) != TYPE_DICTIONARY:
+		subresources = {}
+	for material_name in material_changes.keys():
+		_merge_settings(subresources, "materials", material_name, _material_settings(material_name))
+	for mesh_name in mesh_changes.keys():
+		_merge_settings(subresources, "meshes", mesh_name, _mesh_settings(mesh_name))
+	for mesh_name in prebuilt_lods:
+		_merge_settings(subresources, "meshes", mesh_name, {"generate/lods": 2})
+	config.set_value("params", "_subresources", subresources)
+
+	if needs_post_import:
+		# Points the scene's import script at BlenGoPostImport so object and mesh properties are applied on import.
+		config.set_value("params", "import_script/path", POST_IMPORT_SCRIPT)
+	err = config.save(import_file_path)
+	if err == OK:
 		print("Rewritten import file: ", import_file_path)
 	else:
 		print("Failed to write to import file: ", import_file_path)
 
-# create the _subresources block
-func _generate_materials_block() -> String:
-	if material_changes.size() == 0:
-		return ""
-	var block = "_subresources={\n"
-	block += "\t\"materials\": {\n"
-	for material_name in material_changes.keys():
-		var settings = material_changes[material_name]
-		var new_settings = {}
-		if settings.has("raw"):
-			var raw_value = str(settings["raw"])
-			if raw_value == "ExtGodotMtrl":
-				new_settings["use_external/enabled"] = true
-				new_settings["use_external/path"] = _compute_material_path(material_name)
-			elif raw_value.begins_with("res://"):
-				new_settings["use_external/enabled"] = true
-				new_settings["use_external/path"] = raw_value
-			else:
-				new_settings = settings
-		else:
-			new_settings = settings
-		
-		block += "\t\t\"" + material_name + "\": {\n"
-		for key in new_settings.keys():
-			var value = new_settings[key]
-			var value_str = ""
-			if typeof(value) == TYPE_BOOL:
-				value_str = "true" if value else "false"
-			else:
-				value_str = "\"" + str(value) + "\""
-			block += "\t\t\t\"" + key + "\": " + value_str + ",\n"
-		# Remove trailing comma/newline for this material.
-		block = block.rstrip(",\n") + "\n"
-		block += "\t\t},\n"
-	# Remove trailing comma/newline for the materials block.
-	block = block.rstrip(",\n") + "\n"
-	block += "\t}\n"
-	block += "}"
-	return block
+# Adds settings to one entry of a _subresources section, keeping the options already stored there.
+func _merge_settings(subresources: Dictionary, section: String, item_name: String, settings: Dictionary) -> void:
+	if settings.is_empty():
+		return
+	if not subresources.has(section):
+		subresources[section] = {}
+	var items: Dictionary = subresources[section]
+	if not items.has(item_name):
+		items[item_name] = {}
+	items[item_name].merge(settings, true)
+
+func _has_mesh_settings() -> bool:
+	for mesh_name in mesh_changes.keys():
+		if not _mesh_settings(mesh_name).is_empty():
+			return true
+	return false
+
+func _material_settings(material_name: String) -> Dictionary:
+	var settings = material_changes[material_name]
+	if settings.has("raw"):
+		var raw_value = str(settings["raw"])
+		if raw_value == "ExtGodotMtrl":
+			return {"use_external/enabled": true, "use_external/path": _compute_material_path(material_name)}
+		elif raw_value.begins_with("res://"):
+			return {"use_external/enabled": true, "use_external/path": raw_value}
+	return settings
+
+# Maps blengo_mesh options onto Godot's per-mesh import options (1 = enable, 2 = disable).
+# Meshes BlenGo already exported with a lightmap UV2 keep it instead of being unwrapped again.
+func _mesh_settings(mesh_name: String) -> Dictionary:
+	var settings = {}
+	match mesh_changes[mesh_name]:
+		"LightMapOn":
+			var baked_uv2 = Sidecar.load_index(file_path).get("lightmap_uv2", [])
+			settings["generate/lightmap_uv"] = 2 if baked_uv2.has(mesh_name) else 1
+		"LightMapOff":
+			settings["generate/lightmap_uv"] = 2
+		"ShadowMeshesOn":
+			settings["generate/shadow_meshes"] = 1
+		"ShadowMeshesOff":
+			settings["generate/shadow_meshes"] = 2
+		"LodsOn":
+			settings["generate/lods"] = 1
+		"LodsOff":
+			settings["generate/lods"] = 2
+	return settings
 
 # Computes the external material path based on the GLB file path and material name
 func _compute_material_path(material_name: String) -> String:
@@ -0,0 +1,81 @@
+@tool
+extends RefCounted
+
+# Reads the <scene>.blengo.json property index that BlenGo writes next to every exported scene,
+# so the plugin never has to open and parse the GLB itself.
+
+const PROCESSED_SECTION = "blengo_processed"
+
+static func path_for(scene_path: String) -> String:
+	return scene_path.get_basename() + ".blengo.json"
+
+static func selection_path_for(scene_path: String) -> String:
+	return scene_path.get_basename() + ".blengo.selection.json"
+
+# Records which node and mesh entries were ticked in the Set Properties dialog, so
+# BlenGoPostImport applies only those on every reimport.
+static func save_selection(scene_path: String, nodes: Array, meshes: Array) -> void:
+	var file = FileAccess.open(selection_path_for(scene_path), FileAccess.WRITE)
+	if file == null:
+		print("Failed to write BlenGo selection: ", selection_path_for(scene_path))
+		return
+	file.store_string(JSON.stringify({"nodes": nodes, "meshes": meshes}, "\t"))
+	file.close()
+
+# Returns the saved selection, or an empty dictionary when the scene was never applied with one.
+static func load_selection(scene_path: String) -> Dictionary:
+	var selection_path = selection_path_for(scene_path)
+	if not FileAccess.file_exists(selection_path):
+		return {}
+	var data = JSON.parse_string(FileAccess.get_file_as_string(selection_path))
+	if typeof(data) != TYPE_DICTIONARY:
+		print("Invalid BlenGo selection: ", selection_path)
+		return {}
+	return data
+
+# Returns the parsed sidecar, or an empty dictionary when the scene has none.
+static func load_index(scene_path: String) -> Dictionary:
+	var sidecar_path = path_for(scene_path)
+	if not FileAccess.file_exists(sidecar_path):
+		return {}
+	var data = JSON.parse_string(FileAccess.get_file_as_string(sidecar_path))
+	if typeof(data) != TYPE_DICTIONARY:
+		print("Invalid BlenGo sidecar: ", sidecar_path)
+		return {}
+	return data
+
+# Builds the same Type/Name/Property entries GLBFileFinder extracts from the GLB JSON chunk.
+static func entries_from_index(index: Dictionary) -> Array:
+	var entries = []
+	var materials = index.get("materials", {})
+	for material_name in materials.keys():
+		var material_props = materials[material_name]
+		for prop_key in material_props.keys():
+			if prop_key.begins_with("blengo_"):
+				entries.append({"Type": "Material", "Name": material_name, "Property": material_props[prop_key]})
+	entries.append_array(_first_property_entries(index.get("nodes", {}), "Object"))
+	entries.append_array(_first_property_entries(index.get("meshes", {}), "Mesh"))
+	return entries
+
+static func _first_property_entries(section: Dictionary, type_name: String) -> Array:
+	var entries = []
+	for item_name in section.keys():
+		var props = section[item_name]
+		for key in props.keys():
+			if key.begins_with("blengo_"):
+				entries.append({"Type": type_name, "Name": item_name, "Property": props[key]})
+				break
+	return entries
+
+# True when the scene's sidecar hash matches the one recorded the last time it was processed.
+static func is_processed(scene_path: String, index: Dictionary) -> bool:
+	var sidecar_hash = index.get("hash", "")
+	if sidecar_hash == "":
+		return false
+	var settings = EditorInterface.get_editor_settings()
+	return settings.get_project_metadata(PROCESSED_SECTION, scene_path, "") == sidecar_hash
+
+static func mark_processed(scene_path: String) -> void:
+	var index = load_index(scene_path)
+	if index.has("hash"):
+		EditorInterface.get_editor_settings().set_project_metadata(PROCESSED_SECTION, scene_path, index["hash"])